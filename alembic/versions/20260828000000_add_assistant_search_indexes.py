@@ -0,0 +1,37 @@
+"""Add assistant search indexes
+
+Revision ID: 341fbaa6f8e0
+Revises: aee821a02fc8
+Create Date: 2026-08-28 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "341fbaa6f8e0"
+down_revision = "aee821a02fc8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Btree index covering the user_id + graph_id filters used by the
+    # list/search endpoints
+    op.create_index(
+        "ix_assistant_user_graph",
+        "assistant",
+        ["user_id", "graph_id"],
+    )
+    # GIN index so metadata @> containment searches use an index scan
+    op.create_index(
+        "ix_assistant_metadata_gin",
+        "assistant",
+        ["metadata"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assistant_metadata_gin", table_name="assistant")
+    op.drop_index("ix_assistant_user_graph", table_name="assistant")
@@ -0,0 +1,41 @@
+"""Add trigram indexes for assistant name/description search
+
+Revision ID: 7c2f1d9b4e21
+Revises: 341fbaa6f8e0
+Create Date: 2026-08-28 00:00:01.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c2f1d9b4e21"
+down_revision = "341fbaa6f8e0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Leading-wildcard ILIKE filters in search/count scan the table without
+    # an index; pg_trgm GIN indexes let the planner serve them with a GIN
+    # lookup instead.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_assistant_name_trgm",
+        "assistant",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_assistant_description_trgm",
+        "assistant",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assistant_description_trgm", table_name="assistant")
+    op.drop_index("ix_assistant_name_trgm", table_name="assistant")
@@ -0,0 +1,30 @@
+"""Add composite index for keyset pagination
+
+Revision ID: 9e4b7a2c6d53
+Revises: 7c2f1d9b4e21
+Create Date: 2026-08-28 00:00:02.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e4b7a2c6d53"
+down_revision = "7c2f1d9b4e21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves cursor (keyset) pagination ordered by (created_at, assistant_id)
+    # scoped to a user
+    op.create_index(
+        "ix_assistant_user_created_id",
+        "assistant",
+        ["user_id", sa.text("created_at DESC"), "assistant_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assistant_user_created_id", table_name="assistant")
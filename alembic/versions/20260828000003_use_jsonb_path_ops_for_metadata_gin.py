@@ -0,0 +1,39 @@
+"""Use jsonb_path_ops for the assistant metadata GIN index
+
+Revision ID: 5d1e8c3a7b90
+Revises: 9e4b7a2c6d53
+Create Date: 2026-08-28 00:00:03.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d1e8c3a7b90"
+down_revision = "9e4b7a2c6d53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports @> containment, which is the only
+    # operator the search endpoints use on metadata; the index is smaller
+    # and faster to probe than the default jsonb_ops
+    op.drop_index("ix_assistant_metadata_gin", table_name="assistant")
+    op.create_index(
+        "ix_assistant_metadata_gin",
+        "assistant",
+        ["metadata"],
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assistant_metadata_gin", table_name="assistant")
+    op.create_index(
+        "ix_assistant_metadata_gin",
+        "assistant",
+        ["metadata"],
+        postgresql_using="gin",
+    )
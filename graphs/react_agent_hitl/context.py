@@ -9,7 +9,7 @@ from typing import Annotated
 from . import prompts
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Context:
     """The context for the agent."""
 
@@ -38,9 +38,17 @@ class Context:
 
     def __post_init__(self) -> None:
         """Fetch env vars for attributes that were not passed as args."""
-        for f in fields(self):
-            if not f.init:
-                continue
-
-            if getattr(self, f.name) == f.default:
-                setattr(self, f.name, os.environ.get(f.name.upper(), f.default))
+        env_get = os.environ.get
+        for name, env_key, default in _ENV_FIELDS:
+            if getattr(self, name) == default:
+                setattr(self, name, env_get(env_key, default))
+
+
+# Env-overridable fields, resolved once at import time so each Context
+# construction iterates a small tuple instead of reflecting over fields().
+# Only scalar defaults can meaningfully be overridden by an env string.
+_ENV_FIELDS = tuple(
+    (f.name, f.name.upper(), f.default)
+    for f in fields(Context)
+    if f.init and isinstance(f.default, (str, int, float, bool))
+)
@@ -5,6 +5,7 @@ Works with a chat model with tool calling support.
 
 import json
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Literal, cast
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
@@ -21,9 +22,33 @@ from react_agent_hitl.utils import load_chat_model
 # Define the function that calls the model
 
 
+@lru_cache(maxsize=8)
+def _split_system_prompt(template: str) -> tuple[str, str] | None:
+    """Split a system-prompt template at its {system_time} placeholder.
+
+    Splitting once per template lets call_model inject the timestamp with
+    plain concatenation instead of re-parsing the whole template through
+    str.format on every step. Returns None when there is no placeholder.
+    """
+    if "{system_time}" not in template:
+        return None
+    prefix, _, suffix = template.partition("{system_time}")
+    return prefix, suffix
+
+
+@lru_cache(maxsize=16)
+def _get_bound_model(model_name: str):
+    """Return the chat model for `model_name` with TOOLS already bound.
+
+    Cached so the client construction and the tool JSON-schema serialization
+    in bind_tools happen once per model instead of on every agent step.
+    """
+    return load_chat_model(model_name).bind_tools(TOOLS)
+
+
 async def call_model(
     state: State, runtime: Runtime[Context]
-) -> dict[str, list[AIMessage]]:
+) -> dict[str, list[AIMessage] | int]:
     """Call the LLM powering our "agent".
 
     This function prepares the prompt, initializes the model, and processes the response.
@@ -36,12 +61,14 @@ async def call_model(
         dict: A dictionary containing the model's response message.
     """
     # Initialize the model with tool binding. Change the model or add more tools here.
-    model = load_chat_model(runtime.context.model).bind_tools(TOOLS)
+    model = _get_bound_model(runtime.context.model)
 
     # Format the system prompt. Customize this to change the agent's behavior.
-    system_message = runtime.context.system_prompt.format(
-        system_time=datetime.now(tz=UTC).isoformat()
-    )
+    parts = _split_system_prompt(runtime.context.system_prompt)
+    if parts is None:
+        system_message = runtime.context.system_prompt
+    else:
+        system_message = parts[0] + datetime.now(tz=UTC).isoformat() + parts[1]
 
     # Get the model's response
     response = cast(
@@ -62,13 +89,27 @@ async def call_model(
             ]
         }
 
-    # Return the model's response as a list to be added to existing messages
+    # Return the model's response as a list to be added to existing messages.
+    # When it carries tool calls, record its index (the message is appended
+    # after the current ones) so human_approval can find it in O(1).
+    if response.tool_calls:
+        return {"messages": [response], "last_tool_call_idx": len(state.messages)}
     return {"messages": [response]}
 
 
-def _find_tool_message(messages: list) -> AIMessage | None:
-    """Find the last AI message with tool calls."""
-    for msg in reversed(messages):
+def _find_tool_message(state: State) -> AIMessage | None:
+    """Find the last AI message with tool calls.
+
+    Uses the index recorded by call_model for an O(1) lookup; the backwards
+    scan only remains as a fallback for checkpoints created before the index
+    existed.
+    """
+    idx = state.last_tool_call_idx
+    if idx is not None and idx < len(state.messages):
+        msg = state.messages[idx]
+        if isinstance(msg, AIMessage) and msg.tool_calls:
+            return msg
+    for msg in reversed(state.messages):
         if isinstance(msg, AIMessage) and hasattr(msg, "tool_calls") and msg.tool_calls:
             return msg
     return None
@@ -116,7 +157,7 @@ async def human_approval(state: State) -> Command:
     # ISSUE: Command(goto=END) creates infinite loop due to LangGraph bug
     # GITHUB ISSUE: https://github.com/langchain-ai/langgraph/issues/5572
     # The goto=END command gets ignored and creates "branch:to:__end__" channel error
-    tool_message = _find_tool_message(state.messages)
+    tool_message = _find_tool_message(state)
     if not tool_message:
         return Command(goto=END)
 
@@ -52,3 +52,12 @@ class State(InputState):
     This is a 'managed' variable, controlled by the state machine rather than user code.
     It is set to 'True' when the step count reaches recursion_limit - 1.
     """
+
+    last_tool_call_idx: int | None = field(default=None)
+    """
+    Index into `messages` of the most recent AIMessage carrying tool calls.
+
+    Set by `call_model` whenever it emits tool calls so that `human_approval`
+    can look the message up in O(1) instead of scanning the conversation
+    backwards on every interrupt/resume cycle.
+    """
@@ -11,12 +11,14 @@ Architecture:
 - Service Layer (assistant_service.py): Business logic, validation, orchestration
 """
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from ..core.auth_deps import get_current_user
 from ..models import (
     Assistant,
     AssistantCreate,
+    AssistantCursorList,
     AssistantList,
     AssistantSearchRequest,
     AssistantUpdate,
@@ -39,12 +41,33 @@ async def create_assistant(
 
 @router.get("/assistants", response_model=AssistantList, response_model_by_alias=False)
 async def list_assistants(
+    limit: int = Query(50, ge=1, le=200, description="Maximum results per page"),
+    offset: int = Query(0, ge=0, description="Results offset"),
+    skip_total: bool = Query(
+        False, description="Skip the total count query (for infinite scroll)"
+    ),
     user: User = Depends(get_current_user),
     service: AssistantService = Depends(get_assistant_service),
 ):
     """List user's assistants"""
-    assistants = await service.list_assistants(user.identity)
-    return AssistantList(assistants=assistants, total=len(assistants))
+    assistants, total = await service.list_assistants(
+        user.identity, limit, offset, skip_total
+    )
+    return AssistantList(assistants=assistants, total=total)
+
+
+# NOTE: must be registered before /assistants/{assistant_id} so "stream" is
+# not captured as an assistant id
+@router.get("/assistants/stream")
+async def stream_assistants(
+    user: User = Depends(get_current_user),
+    service: AssistantService = Depends(get_assistant_service),
+):
+    """Stream user's assistants as JSON without materializing the full list"""
+    return StreamingResponse(
+        service.stream_assistants(user.identity),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -59,6 +82,40 @@ async def search_assistants(
     return await service.search_assistants(request, user.identity)
 
 
+@router.post(
+    "/assistants/search/cursor",
+    response_model=AssistantCursorList,
+    response_model_by_alias=False,
+)
+async def search_assistants_cursor(
+    request: AssistantSearchRequest,
+    user: User = Depends(get_current_user),
+    service: AssistantService = Depends(get_assistant_service),
+):
+    """Search assistants with keyset pagination (pass cursor_after to page)"""
+    assistants, next_cursor = await service.search_assistants_cursor(
+        request, user.identity
+    )
+    return AssistantCursorList(assistants=assistants, next_cursor=next_cursor)
+
+
+@router.post(
+    "/assistants/search/total",
+    response_model=AssistantList,
+    response_model_by_alias=False,
+)
+async def search_assistants_with_total(
+    request: AssistantSearchRequest,
+    user: User = Depends(get_current_user),
+    service: AssistantService = Depends(get_assistant_service),
+):
+    """Search assistants and return the page together with the total count"""
+    assistants, total = await service.search_assistants_with_total(
+        request, user.identity
+    )
+    return AssistantList(assistants=assistants, total=total)
+
+
 @router.post("/assistants/count", response_model=int)
 async def count_assistants(
     request: AssistantSearchRequest,
@@ -68,6 +68,32 @@ class Assistant(Base):
             "config",
             unique=True,
         ),
+        Index("ix_assistant_user_graph", "user_id", "graph_id"),
+        Index(
+            "ix_assistant_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_assistant_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_assistant_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        # Serves keyset pagination ordered by (created_at, assistant_id)
+        Index(
+            "ix_assistant_user_created_id",
+            "user_id",
+            text("created_at DESC"),
+            "assistant_id",
+        ),
     )
 
 
@@ -24,7 +24,7 @@ import structlog
 from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.authentication import AuthenticationMiddleware
 
 from .api.assistants import router as assistants_router
@@ -87,6 +87,9 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # orjson renders response bodies faster than the stdlib json encoder
+    # used by the default JSONResponse
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(StructLogMiddleware)
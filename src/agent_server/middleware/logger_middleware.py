@@ -19,6 +19,13 @@ class AccessInfo(TypedDict, total=False):
 class StructLogMiddleware:
     def __init__(self, app: ASGIApp):
         self.app = app
+        # Resolved once here instead of per request: the env var cannot
+        # change under a running process, and binding the logger methods
+        # skips the module-level attribute lookups on the hot path
+        self._verbose = os.getenv("LOG_VERBOSITY", "standard").lower() == "verbose"
+        self._log_info = access_logger.info
+        self._log_warning = access_logger.warning
+        self._log_error = access_logger.error
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # If the request is not an HTTP request, we don't need to do anything special
@@ -64,31 +71,30 @@ class StructLogMiddleware:
                 "method": http_method,
                 "version": http_version,
             }
-            if os.getenv("LOG_VERBOSITY", "standard").lower() == "verbose":
+            if self._verbose:
                 log_data["request_id"] = correlation_id.get()
 
             status_code = info.get("status_code", 500)
+            # Warning for client errors (4xx), error for server errors
+            # (5xx), normal log otherwise (2xx, 3xx)
             if 400 <= status_code < 500:
-                # Log as warning for client errors (4xx)
-                access_logger.warning(
-                    f"""{client_host}:{client_port} - "{http_method} {scope["path"]} HTTP/{http_version}" {status_code}""",
-                    http=log_data,
-                    network={"client": {"ip": client_host, "port": client_port}},
-                    duration=process_time,
-                )
+                log = self._log_warning
             elif 500 <= status_code < 600:
-                # Log as error for server errors (5xx)
-                access_logger.error(
-                    f"""{client_host}:{client_port} - "{http_method} {scope["path"]} HTTP/{http_version}" {status_code}""",
-                    http=log_data,
-                    network={"client": {"ip": client_host, "port": client_port}},
-                    duration=process_time,
-                )
+                log = self._log_error
             else:
-                # Normal log for successful responses (2xx, 3xx)
-                access_logger.info(
-                    f"""{client_host}:{client_port} - "{http_method} {scope["path"]} HTTP/{http_version}" {status_code}""",
-                    http=log_data,
-                    network={"client": {"ip": client_host, "port": client_port}},
-                    duration=process_time,
-                )
+                log = self._log_info
+            # %s-style positional args so PositionalArgumentsFormatter only
+            # builds the human-readable line when the record survives level
+            # filtering, instead of f-string formatting it up front
+            log(
+                '%s:%s - "%s %s HTTP/%s" %s',
+                client_host,
+                client_port,
+                http_method,
+                scope["path"],
+                http_version,
+                status_code,
+                http=log_data,
+                network={"client": {"ip": client_host, "port": client_port}},
+                duration=process_time,
+            )
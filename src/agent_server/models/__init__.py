@@ -4,6 +4,7 @@ from .assistants import (
     AgentSchemas,
     Assistant,
     AssistantCreate,
+    AssistantCursorList,
     AssistantList,
     AssistantSearchRequest,
     AssistantUpdate,
@@ -35,6 +36,7 @@ __all__ = [
     # Assistants
     "Assistant",
     "AssistantCreate",
+    "AssistantCursorList",
     "AssistantList",
     "AssistantSearchRequest",
     "AssistantUpdate",
@@ -72,7 +72,9 @@ class AssistantList(BaseModel):
     """Response model for listing assistants"""
 
     assistants: list[Assistant]
-    total: int
+    total: int | None = Field(
+        None, description="Total matching assistants (null when skip_total is set)"
+    )
 
 
 class AssistantSearchRequest(BaseModel):
@@ -86,6 +88,22 @@ class AssistantSearchRequest(BaseModel):
     metadata: dict[str, Any] | None = Field(
         {}, description="Metadata to use for searching and filtering assistants."
     )
+    cursor_after: str | None = Field(
+        None,
+        description=(
+            "Opaque cursor from a previous page for keyset pagination. "
+            "When set, offset is ignored."
+        ),
+    )
+
+
+class AssistantCursorList(BaseModel):
+    """Response model for cursor-paginated assistant search"""
+
+    assistants: list[Assistant]
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null at end of results"
+    )
 
 
 class AgentSchemas(BaseModel):
@@ -7,8 +7,6 @@ from .base import ObservabilityProvider
 
 logger = structlog.getLogger(__name__)
 
-_LANGFUSE_LOGGING_ENABLED = os.getenv("LANGFUSE_LOGGING", "false").lower() == "true"
-
 
 class LangfuseProvider(ObservabilityProvider):
     """Langfuse observability provider."""
@@ -60,8 +58,12 @@ class LangfuseProvider(ObservabilityProvider):
         return metadata
 
     def is_enabled(self) -> bool:
-        """Check if Langfuse is enabled."""
-        return _LANGFUSE_LOGGING_ENABLED
+        """Check if Langfuse is enabled.
+
+        Read at call time so env changes (and tests) don't require a
+        module reload.
+        """
+        return os.getenv("LANGFUSE_LOGGING", "false").lower() == "true"
 
 
 # Create and register the Langfuse provider
@@ -14,40 +14,125 @@ This is the first service layer implementation in Aegra. The pattern will be
 applied to other APIs (runs, threads, crons) as part of ongoing refactoring.
 """
 
-import uuid
+import asyncio
+import base64
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import delete, func, lambda_stmt, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.orm import Assistant as AssistantORM
 from ..core.orm import AssistantVersion as AssistantVersionORM
-from ..core.orm import get_session
+from ..core.orm import _get_session_maker, get_session
 from ..models import Assistant, AssistantCreate, AssistantUpdate
 from ..services.langgraph_service import LangGraphService, get_langgraph_service
 
 
-def to_pydantic(row: AssistantORM) -> Assistant:
-    """Convert SQLAlchemy ORM object to Pydantic model with proper type casting.
+# (pydantic field, ORM attribute) pairs, computed once at import so the
+# per-row conversion does plain attribute reads instead of walking
+# __table__.columns on every call. The metadata_dict ORM attribute feeds
+# the Assistant.metadata field.
+_ASSISTANT_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    ("metadata" if key == "metadata_dict" else key, key)
+    for key in AssistantORM.__mapper__.columns.keys()
+)
 
-    Uses from_attributes=True because Assistant ORM has attribute/column name mismatch:
-    - ORM attribute: metadata_dict
-    - DB column: metadata
-    - Pydantic field: metadata (with alias="metadata_dict")
+# JSONB columns default server-side; a NULL from an older row must not leak
+# through as None since these fields are typed as dict
+_ASSISTANT_DICT_FIELDS = frozenset({"config", "context", "metadata"})
 
-    This is different from Thread/Run where attribute names match column names.
+
+def _build_row_converter():
+    """Generate a straight-line ORM-row-to-Assistant converter.
+
+    The column set is fixed at import time, so instead of a per-row loop
+    over (field, attribute) pairs the converter is exec'd once as plain
+    keyword arguments — no dict intermediate, no reflection per call.
+    Rows coming off our own table are already the right types (TEXT ids
+    are str, JSONB is dict), so model_construct skips the pydantic-core
+    validation pass entirely.
     """
-    # Cast UUIDs to str so they match the Pydantic schema
-    if hasattr(row, "assistant_id") and row.assistant_id is not None:
-        row.assistant_id = str(row.assistant_id)
-    if hasattr(row, "user_id") and isinstance(row.user_id, uuid.UUID):
-        row.user_id = str(row.user_id)
+    kwargs = ", ".join(
+        f"{field}=row.{attr} or {{}}"
+        if field in _ASSISTANT_DICT_FIELDS
+        else f"{field}=row.{attr}"
+        for field, attr in _ASSISTANT_FIELDS
+    )
+    source = (
+        "def to_pydantic(row):\n"
+        f"    return Assistant.model_construct({kwargs})\n"
+    )
+    namespace = {"Assistant": Assistant}
+    exec(source, namespace)  # noqa: S102 - input is our own column names
+    return namespace["to_pydantic"]
 
-    # Use Pydantic's built-in ORM conversion with from_attributes=True
-    return Assistant.model_validate(row, from_attributes=True)
+
+#: Convert a SQLAlchemy ORM row to the Assistant Pydantic model.
+to_pydantic = _build_row_converter()
+
+
+def _version_to_pydantic(
+    version: AssistantVersionORM, assistant_id: str, user_identity: str
+) -> Assistant:
+    """Convert a version row to an Assistant snapshot without validation.
+
+    Versions carry no updated_at of their own: a version is immutable once
+    written, so its created_at serves as both timestamps.
+    """
+    return Assistant.model_construct(
+        assistant_id=assistant_id,
+        name=version.name,
+        description=version.description,
+        config=version.config or {},
+        context=version.context or {},
+        graph_id=version.graph_id,
+        user_id=user_identity,
+        version=version.version,
+        created_at=version.created_at,
+        updated_at=version.created_at,
+        metadata=version.metadata_dict or {},
+    )
+
+
+def _encode_cursor(created_at: datetime, assistant_id: str) -> str:
+    """Encode a (created_at, assistant_id) keyset position as an opaque token."""
+    raw = f"{created_at.isoformat()}|{assistant_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor; 400 on malformed input."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, _, assistant_id = raw.partition("|")
+        return datetime.fromisoformat(timestamp), assistant_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(400, "Invalid pagination cursor") from e
+
+
+def _build_search_where(request: Any, user_identity: str) -> list[Any]:
+    """Build the WHERE clauses shared by the count and search+total queries.
+
+    search_assistants applies the same predicate, but via lambda_stmt
+    chaining so its compiled SQL is cached per filter shape; keep the two in
+    sync when adding filters."""
+    clauses: list[Any] = [
+        or_(AssistantORM.user_id == user_identity, AssistantORM.user_id == "system")
+    ]
+    if request.name:
+        clauses.append(AssistantORM.name.ilike(f"%{request.name}%"))
+    if request.description:
+        clauses.append(AssistantORM.description.ilike(f"%{request.description}%"))
+    if request.graph_id:
+        clauses.append(AssistantORM.graph_id == request.graph_id)
+    if request.metadata:
+        clauses.append(AssistantORM.metadata_dict.op("@>")(request.metadata))
+    return clauses
 
 
 def _state_jsonschema(graph) -> dict | None:
@@ -94,32 +179,40 @@ def _get_configurable_jsonschema(graph) -> dict:
     return {}
 
 
-def _extract_graph_schemas(graph) -> dict:
-    """Extract schemas from a compiled LangGraph graph object"""
-    try:
-        input_schema = graph.get_input_jsonschema()
-    except Exception:
-        input_schema = None
+# Extracted schemas keyed by graph_id. Graph definitions are fixed for the
+# life of the process (the registry is loaded once at startup), so schema
+# extraction runs once per graph instead of once per request.
+_graph_schema_cache: dict[str, dict] = {}
 
-    try:
-        output_schema = graph.get_output_jsonschema()
-    except Exception:
-        output_schema = None
 
+def _try_schema(fn) -> dict | None:
+    """Run one schema extractor, mapping any failure to None."""
     try:
-        state_schema = _state_jsonschema(graph)
+        return fn()
     except Exception:
-        state_schema = None
+        return None
 
-    try:
-        config_schema = _get_configurable_jsonschema(graph)
-    except Exception:
-        config_schema = None
 
-    try:
-        context_schema = graph.get_context_jsonschema()
-    except Exception:
-        context_schema = None
+async def _extract_graph_schemas(graph) -> dict:
+    """Extract schemas from a compiled LangGraph graph object.
+
+    The five extractors are independent and CPU-bound on recursive
+    model_json_schema() calls, so they run concurrently on worker threads;
+    the event loop keeps serving other requests meanwhile.
+    """
+    (
+        input_schema,
+        output_schema,
+        state_schema,
+        config_schema,
+        context_schema,
+    ) = await asyncio.gather(
+        asyncio.to_thread(_try_schema, lambda: graph.get_input_jsonschema()),
+        asyncio.to_thread(_try_schema, lambda: graph.get_output_jsonschema()),
+        asyncio.to_thread(_try_schema, lambda: _state_jsonschema(graph)),
+        asyncio.to_thread(_try_schema, lambda: _get_configurable_jsonschema(graph)),
+        asyncio.to_thread(_try_schema, lambda: graph.get_context_jsonschema()),
+    )
 
     return {
         "input_schema": input_schema,
@@ -141,16 +234,15 @@ class AssistantService:
         self, request: AssistantCreate, user_identity: str
     ) -> Assistant:
         """Create a new assistant"""
-        # Get LangGraph service to validate graph
-        available_graphs = self.langgraph_service.list_graphs()
-
         # Use graph_id as the main identifier
         graph_id = request.graph_id
 
-        if graph_id not in available_graphs:
+        # O(1) membership test against the frozenset cached at startup; the
+        # heavier get_graph() load only runs once this cheap check passes
+        if graph_id not in self.langgraph_service.available_graph_ids:
             raise HTTPException(
                 400,
-                f"Graph '{graph_id}' not found in aegra.json. Available: {list(available_graphs.keys())}",
+                f"Graph '{graph_id}' not found in aegra.json. Available: {sorted(self.langgraph_service.available_graph_ids)}",
             )
 
         # Validate graph can be loaded
@@ -180,47 +272,56 @@ class AssistantService:
         # Generate name if not provided
         name = request.name or f"Assistant for {graph_id}"
 
-        # Check if an assistant already exists for this user, graph and config pair
-        existing_stmt = select(AssistantORM).where(
-            AssistantORM.user_id == user_identity,
-            or_(
-                (AssistantORM.graph_id == graph_id) & (AssistantORM.config == config),
-                AssistantORM.assistant_id == assistant_id,
-            ),
+        # Insert and detect duplicates in one statement: ON CONFLICT DO NOTHING
+        # returns no row when the unique indexes on (user_id, assistant_id) or
+        # (user_id, graph_id, config) already hold a match, which replaces the
+        # old SELECT-then-INSERT round trip and its TOCTOU race. Timestamps are
+        # set client-side so no post-commit refresh round-trip is needed.
+        now = datetime.now(UTC)
+        insert_stmt = (
+            pg_insert(AssistantORM)
+            .values(
+                assistant_id=assistant_id,
+                name=name,
+                description=request.description,
+                config=config,
+                context=context,
+                graph_id=graph_id,
+                user_id=user_identity,
+                metadata_dict=request.metadata,
+                version=1,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing()
+            .returning(AssistantORM.assistant_id)
         )
-        existing = await self.session.scalar(existing_stmt)
+        result = await self.session.execute(insert_stmt)
 
-        if existing:
-            if request.if_exists == "do_nothing":
+        if result.scalar_one_or_none() is None:
+            # Conflict: fetch the existing row and apply the if_exists policy
+            existing_stmt = select(AssistantORM).where(
+                AssistantORM.user_id == user_identity,
+                or_(
+                    (AssistantORM.graph_id == graph_id)
+                    & (AssistantORM.config == config),
+                    AssistantORM.assistant_id == assistant_id,
+                ),
+            )
+            existing = await self.session.scalar(existing_stmt)
+            if existing and request.if_exists == "do_nothing":
                 return to_pydantic(existing)
-            else:  # error (default)
-                raise HTTPException(409, f"Assistant '{assistant_id}' already exists")
-
-        # Create assistant record
-        assistant_orm = AssistantORM(
-            assistant_id=assistant_id,
-            name=name,
-            description=request.description,
-            config=config,
-            context=context,
-            graph_id=graph_id,
-            user_id=user_identity,
-            metadata_dict=request.metadata,
-            version=1,
-        )
+            raise HTTPException(409, f"Assistant '{assistant_id}' already exists")
 
-        self.session.add(assistant_orm)
-        await self.session.commit()
-        await self.session.refresh(assistant_orm)
-
-        # Create initial version record
+        # Create initial version record in the same transaction so a failure
+        # cannot leave a versionless assistant behind
         assistant_version_orm = AssistantVersionORM(
             assistant_id=assistant_id,
             version=1,
             graph_id=graph_id,
             config=config,
             context=context,
-            created_at=datetime.now(UTC),
+            created_at=now,
             name=name,
             description=request.description,
             metadata_dict=request.metadata,
@@ -228,73 +329,193 @@ class AssistantService:
         self.session.add(assistant_version_orm)
         await self.session.commit()
 
-        return to_pydantic(assistant_orm)
+        return Assistant(
+            assistant_id=assistant_id,
+            name=name,
+            description=request.description,
+            config=config,
+            context=context,
+            graph_id=graph_id,
+            user_id=user_identity,
+            version=1,
+            metadata=request.metadata or {},
+            created_at=now,
+            updated_at=now,
+        )
 
-    async def list_assistants(self, user_identity: str) -> list[Assistant]:
-        """List user's assistants"""
-        # Filter assistants by user
-        stmt = select(AssistantORM).where(AssistantORM.user_id == user_identity)
-        result = await self.session.scalars(stmt)
-        user_assistants = [to_pydantic(a) for a in result.all()]
-        return user_assistants
+    async def list_assistants(
+        self,
+        user_identity: str,
+        limit: int = 50,
+        offset: int = 0,
+        skip_total: bool = False,
+    ) -> tuple[list[Assistant], int | None]:
+        """List a page of the user's assistants together with the total count.
+
+        The page and count queries are independent, so they run concurrently:
+        the page on this service's session and the count on a short-lived
+        second session (a single AsyncSession cannot run two statements at
+        once). Infinite-scroll clients can pass skip_total to drop the count
+        query entirely; total is then None.
+        """
+        page_stmt = (
+            select(AssistantORM)
+            .where(AssistantORM.user_id == user_identity)
+            .order_by(AssistantORM.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+        if skip_total:
+            result = await self.session.scalars(page_stmt)
+            return [to_pydantic(a) for a in result.all()], None
+
+        count_stmt = select(func.count()).where(AssistantORM.user_id == user_identity)
+
+        async def _count() -> int:
+            async with _get_session_maker()() as session:
+                return await session.scalar(count_stmt) or 0
+
+        result, total = await asyncio.gather(self.session.scalars(page_stmt), _count())
+        return [to_pydantic(a) for a in result.all()], total
+
+    async def stream_assistants(self, user_identity: str) -> AsyncIterator[bytes]:
+        """Stream the user's assistants as a JSON payload one row at a time.
+
+        Uses stream_scalars so peak memory stays at one row regardless of
+        result-set size; the paginated list endpoint remains the default for
+        typical page sizes.
+        """
+        stmt = (
+            select(AssistantORM)
+            .where(AssistantORM.user_id == user_identity)
+            .order_by(AssistantORM.created_at.desc())
+        )
+        result = await self.session.stream_scalars(stmt)
+
+        yield b'{"assistants":['
+        first = True
+        async for row in result:
+            if first:
+                first = False
+            else:
+                yield b","
+            yield to_pydantic(row).model_dump_json().encode()
+        yield b"]}"
 
     async def search_assistants(
         self,
         request: Any,  # AssistantSearchRequest
         user_identity: str,
     ) -> list[Assistant]:
-        """Search assistants with filters"""
-        # Start with user's assistants
-        stmt = select(AssistantORM).where(
-            or_(AssistantORM.user_id == user_identity, AssistantORM.user_id == "system")
+        """Search assistants with filters.
+
+        Built with lambda_stmt so SQLAlchemy caches the compiled SQL per
+        filter shape; repeated searches skip the statement-compilation pass
+        and only the bound values change.
+        """
+        stmt = lambda_stmt(
+            lambda: select(AssistantORM).where(
+                or_(
+                    AssistantORM.user_id == user_identity,
+                    AssistantORM.user_id == "system",
+                )
+            )
         )
-
-        # Apply filters
         if request.name:
-            stmt = stmt.where(AssistantORM.name.ilike(f"%{request.name}%"))
-
+            name_pat = f"%{request.name}%"
+            stmt += lambda s: s.where(AssistantORM.name.ilike(name_pat))
         if request.description:
-            stmt = stmt.where(
-                AssistantORM.description.ilike(f"%{request.description}%")
-            )
-
+            description_pat = f"%{request.description}%"
+            stmt += lambda s: s.where(AssistantORM.description.ilike(description_pat))
         if request.graph_id:
-            stmt = stmt.where(AssistantORM.graph_id == request.graph_id)
-
+            graph_id = request.graph_id
+            stmt += lambda s: s.where(AssistantORM.graph_id == graph_id)
         if request.metadata:
-            stmt = stmt.where(AssistantORM.metadata_dict.op("@>")(request.metadata))
+            metadata = request.metadata
+            stmt += lambda s: s.where(AssistantORM.metadata_dict.op("@>")(metadata))
 
         # Apply pagination
         offset = request.offset or 0
         limit = request.limit or 20
-        stmt = stmt.offset(offset).limit(limit)
+        stmt += lambda s: s.offset(offset).limit(limit)
 
         result = await self.session.scalars(stmt)
         paginated_assistants = [to_pydantic(a) for a in result.all()]
 
         return paginated_assistants
 
-    async def count_assistants(
+    async def search_assistants_with_total(
         self,
         request: Any,  # AssistantSearchRequest
         user_identity: str,
-    ) -> int:
-        """Count assistants with filters"""
-        stmt = select(func.count()).where(AssistantORM.user_id == user_identity)
+    ) -> tuple[list[Assistant], int]:
+        """Search assistants and count the matches in one round trip.
+
+        Clients following a search with a count request pay for the two
+        queries sequentially; here both share the same WHERE clauses and run
+        concurrently, so wall time is max(page, count) instead of their sum.
+        The count runs on a short-lived second session because a single
+        AsyncSession cannot execute two statements at once.
+        """
+        clauses = _build_search_where(request, user_identity)
+        page_stmt = (
+            select(AssistantORM)
+            .where(*clauses)
+            .offset(request.offset or 0)
+            .limit(request.limit or 20)
+        )
+        count_stmt = select(func.count()).where(*clauses)
 
-        if request.name:
-            stmt = stmt.where(AssistantORM.name.ilike(f"%{request.name}%"))
+        async def _count() -> int:
+            async with _get_session_maker()() as session:
+                return await session.scalar(count_stmt) or 0
 
-        if request.description:
+        result, total = await asyncio.gather(self.session.scalars(page_stmt), _count())
+        return [to_pydantic(a) for a in result.all()], total
+
+    async def search_assistants_cursor(
+        self,
+        request: Any,  # AssistantSearchRequest
+        user_identity: str,
+    ) -> tuple[list[Assistant], str | None]:
+        """Search assistants with keyset (cursor) pagination.
+
+        Offset pagination scans and discards `offset` rows per page; the
+        keyset variant seeks straight to the (created_at, assistant_id)
+        position from the cursor via the composite index, so page cost stays
+        O(log N) regardless of page depth and pages stay stable under
+        concurrent inserts. Fetches limit+1 rows to detect the last page.
+        """
+        limit = request.limit or 20
+        stmt = select(AssistantORM).where(*_build_search_where(request, user_identity))
+        if request.cursor_after:
+            c_ts, c_id = _decode_cursor(request.cursor_after)
             stmt = stmt.where(
-                AssistantORM.description.ilike(f"%{request.description}%")
+                tuple_(AssistantORM.created_at, AssistantORM.assistant_id)
+                < (c_ts, c_id)
             )
+        stmt = stmt.order_by(
+            AssistantORM.created_at.desc(), AssistantORM.assistant_id.desc()
+        ).limit(limit + 1)
 
-        if request.graph_id:
-            stmt = stmt.where(AssistantORM.graph_id == request.graph_id)
+        result = await self.session.scalars(stmt)
+        rows = result.all()
 
-        if request.metadata:
-            stmt = stmt.where(AssistantORM.metadata_dict.op("@>")(request.metadata))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor(last.created_at, last.assistant_id)
+        return [to_pydantic(row) for row in rows], next_cursor
+
+    async def count_assistants(
+        self,
+        request: Any,  # AssistantSearchRequest
+        user_identity: str,
+    ) -> int:
+        """Count assistants with filters"""
+        stmt = select(func.count()).where(*_build_search_where(request, user_identity))
 
         total = await self.session.scalar(stmt)
         return total or 0
@@ -334,36 +555,29 @@ class AssistantService:
         elif context:
             config["configurable"] = context
 
-        stmt = select(AssistantORM).where(
-            AssistantORM.assistant_id == assistant_id,
-            AssistantORM.user_id == user_identity,
-        )
-        assistant = await self.session.scalar(stmt)
-        if not assistant:
-            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
-
+        # Single atomic UPDATE ... RETURNING: the next version number is
+        # computed from the versions table inside the statement, replacing the
+        # old SELECT -> SELECT max(version) -> INSERT -> UPDATE -> SELECT
+        # sequence (and its race window between the max() read and the write)
         now = datetime.now(UTC)
-        version_stmt = select(func.max(AssistantVersionORM.version)).where(
-            AssistantVersionORM.assistant_id == assistant_id
+        next_version = (
+            select(func.coalesce(func.max(AssistantVersionORM.version), 0) + 1)
+            .where(AssistantVersionORM.assistant_id == assistant_id)
+            .scalar_subquery()
         )
-        max_version = await self.session.scalar(version_stmt)
-        new_version = (max_version or 1) + 1 if max_version is not None else 1
-
-        new_version_details = {
-            "assistant_id": assistant_id,
-            "version": new_version,
-            "graph_id": request.graph_id or assistant.graph_id,
+        values: dict[str, Any] = {
             "config": config,
             "context": context,
-            "created_at": now,
-            "name": request.name or assistant.name,
-            "description": request.description or assistant.description,
-            "metadata_dict": metadata,
+            "version": next_version,
+            "updated_at": now,
         }
-
-        assistant_version_orm = AssistantVersionORM(**new_version_details)
-        self.session.add(assistant_version_orm)
-        await self.session.commit()
+        # Fall back to the stored values for fields the request leaves unset
+        if request.name:
+            values["name"] = request.name
+        if request.description:
+            values["description"] = request.description
+        if request.graph_id:
+            values["graph_id"] = request.graph_id
 
         assistant_update = (
             update(AssistantORM)
@@ -371,49 +585,52 @@ class AssistantService:
                 AssistantORM.assistant_id == assistant_id,
                 AssistantORM.user_id == user_identity,
             )
-            .values(
-                name=new_version_details["name"],
-                description=new_version_details["description"],
-                graph_id=new_version_details["graph_id"],
-                config=new_version_details["config"],
-                context=new_version_details["context"],
-                version=new_version,
-                updated_at=now,
-            )
+            .values(**values)
+            .returning(AssistantORM)
         )
-        await self.session.execute(assistant_update)
+        result = await self.session.execute(assistant_update)
+        updated_assistant = result.scalar_one_or_none()
+        if updated_assistant is None:
+            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
+
+        # Record the new version in the same transaction
+        assistant_version_orm = AssistantVersionORM(
+            assistant_id=assistant_id,
+            version=updated_assistant.version,
+            graph_id=updated_assistant.graph_id,
+            config=config,
+            context=context,
+            created_at=now,
+            name=updated_assistant.name,
+            description=updated_assistant.description,
+            metadata_dict=metadata,
+        )
+        self.session.add(assistant_version_orm)
         await self.session.commit()
-        updated_assistant = await self.session.scalar(stmt)
         return to_pydantic(updated_assistant)
 
     async def delete_assistant(self, assistant_id: str, user_identity: str) -> dict:
-        """Delete assistant by ID"""
-        stmt = select(AssistantORM).where(
+        """Delete assistant by ID.
+
+        A single DELETE ... WHERE; rowcount distinguishes 404 from success,
+        so no row is SELECTed into the identity map just to be discarded.
+        """
+        delete_stmt = delete(AssistantORM).where(
             AssistantORM.assistant_id == assistant_id,
             AssistantORM.user_id == user_identity,
         )
-        assistant = await self.session.scalar(stmt)
+        result = await self.session.execute(delete_stmt)
+        await self.session.commit()
 
-        if not assistant:
+        if result.rowcount == 0:
             raise HTTPException(404, f"Assistant '{assistant_id}' not found")
 
-        await self.session.delete(assistant)
-        await self.session.commit()
-
         return {"status": "deleted"}
 
     async def set_assistant_latest(
         self, assistant_id: str, version: int, user_identity: str
     ) -> Assistant:
         """Set the given version as the latest version of an assistant"""
-        stmt = select(AssistantORM).where(
-            AssistantORM.assistant_id == assistant_id,
-            AssistantORM.user_id == user_identity,
-        )
-        assistant = await self.session.scalar(stmt)
-        if not assistant:
-            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
-
         version_stmt = select(AssistantVersionORM).where(
             AssistantVersionORM.assistant_id == assistant_id,
             AssistantVersionORM.version == version,
@@ -424,6 +641,9 @@ class AssistantService:
                 404, f"Version '{version}' for Assistant '{assistant_id}' not found"
             )
 
+        # RETURNING hands back the fresh row, so neither a pre-SELECT of the
+        # assistant nor a re-SELECT after the commit is needed; an empty
+        # result doubles as the 404 check
         assistant_update = (
             update(AssistantORM)
             .where(
@@ -439,100 +659,99 @@ class AssistantService:
                 version=version,
                 updated_at=datetime.now(UTC),
             )
+            .returning(AssistantORM)
         )
-        await self.session.execute(assistant_update)
+        result = await self.session.execute(assistant_update)
+        updated_assistant = result.scalar_one_or_none()
+        if updated_assistant is None:
+            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
         await self.session.commit()
-        updated_assistant = await self.session.scalar(stmt)
         return to_pydantic(updated_assistant)
 
     async def list_assistant_versions(
         self, assistant_id: str, user_identity: str
     ) -> list[Assistant]:
-        """List all versions of an assistant"""
-        stmt = select(AssistantORM).where(
-            AssistantORM.assistant_id == assistant_id,
-            or_(
-                AssistantORM.user_id == user_identity, AssistantORM.user_id == "system"
-            ),
+        """List all versions of an assistant.
+
+        A single query gated on EXISTS covers the common path; the separate
+        assistant lookup only runs when nothing comes back, to pick the
+        right 404 message.
+        """
+        access_clause = or_(
+            AssistantORM.user_id == user_identity, AssistantORM.user_id == "system"
+        )
+        exists_gate = (
+            select(1)
+            .where(AssistantORM.assistant_id == assistant_id, access_clause)
+            .exists()
         )
-        assistant = await self.session.scalar(stmt)
-        if not assistant:
-            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
-
         stmt = (
             select(AssistantVersionORM)
-            .where(AssistantVersionORM.assistant_id == assistant_id)
+            .where(AssistantVersionORM.assistant_id == assistant_id, exists_gate)
             .order_by(AssistantVersionORM.version.desc())
         )
         result = await self.session.scalars(stmt)
         versions = result.all()
 
         if not versions:
+            # Distinguish a missing assistant from one that has no versions
+            assistant = await self.session.scalar(
+                select(AssistantORM).where(
+                    AssistantORM.assistant_id == assistant_id, access_clause
+                )
+            )
+            if not assistant:
+                raise HTTPException(404, f"Assistant '{assistant_id}' not found")
             raise HTTPException(
                 404, f"No versions found for Assistant '{assistant_id}'"
             )
 
-        # Convert to Pydantic models
-        version_list = [
-            Assistant(
-                assistant_id=assistant_id,
-                name=v.name,
-                description=v.description,
-                config=v.config or {},
-                context=v.context or {},
-                graph_id=v.graph_id,
-                user_id=user_identity,
-                version=v.version,
-                created_at=v.created_at,
-                updated_at=v.created_at,
-                metadata_dict=v.metadata_dict or {},
-            )
-            for v in versions
-        ]
+        return [_version_to_pydantic(v, assistant_id, user_identity) for v in versions]
 
-        return version_list
+    async def _get_owned_graph_id(self, assistant_id: str, user_identity: str) -> str:
+        """Resolve an assistant's graph_id, 404ing on missing or foreign rows.
 
-    async def get_assistant_schemas(
-        self, assistant_id: str, user_identity: str
-    ) -> dict:
-        """Get input, output, state, config and context schemas for an assistant"""
-        stmt = select(AssistantORM).where(
+        The graph endpoints only need the graph_id, so this selects the one
+        column instead of materializing the full ORM row just to 404-check.
+        """
+        stmt = select(AssistantORM.graph_id).where(
             AssistantORM.assistant_id == assistant_id,
             or_(
                 AssistantORM.user_id == user_identity, AssistantORM.user_id == "system"
             ),
         )
-        assistant = await self.session.scalar(stmt)
+        graph_id = await self.session.scalar(stmt)
 
-        if not assistant:
+        if not graph_id:
             raise HTTPException(404, f"Assistant '{assistant_id}' not found")
+        return graph_id
 
-        try:
-            graph = await self.langgraph_service.get_graph(assistant.graph_id)
-            schemas = _extract_graph_schemas(graph)
-
-            return {"graph_id": assistant.graph_id, **schemas}
+    async def get_assistant_schemas(
+        self, assistant_id: str, user_identity: str
+    ) -> dict:
+        """Get input, output, state, config and context schemas for an assistant"""
+        graph_id = await self._get_owned_graph_id(assistant_id, user_identity)
+        schemas = _graph_schema_cache.get(graph_id)
+        if schemas is None:
+            try:
+                graph = await self.langgraph_service.get_graph(graph_id)
+                schemas = await _extract_graph_schemas(graph)
+            except Exception as e:
+                raise HTTPException(
+                    400, f"Failed to extract schemas: {str(e)}"
+                ) from e
+            _graph_schema_cache[graph_id] = schemas
 
-        except Exception as e:
-            raise HTTPException(400, f"Failed to extract schemas: {str(e)}") from e
+        return {"graph_id": graph_id, **schemas}
 
     async def get_assistant_graph(
         self, assistant_id: str, xray: bool | int, user_identity: str
     ) -> dict:
         """Get the graph structure for visualization"""
-        stmt = select(AssistantORM).where(
-            AssistantORM.assistant_id == assistant_id,
-            or_(
-                AssistantORM.user_id == user_identity, AssistantORM.user_id == "system"
-            ),
-        )
-        assistant = await self.session.scalar(stmt)
-
-        if not assistant:
-            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
+        graph_id = await self._get_owned_graph_id(assistant_id, user_identity)
 
         try:
-            graph = await self.langgraph_service.get_graph(assistant.graph_id)
+            graph = await self.langgraph_service.get_graph(graph_id)
 
             # Validate xray if it's an integer (not a boolean)
             if isinstance(xray, int) and not isinstance(xray, bool) and xray <= 0:
@@ -565,28 +784,24 @@ class AssistantService:
         user_identity: str,
     ) -> dict:
         """Get subgraphs of an assistant"""
-        stmt = select(AssistantORM).where(
-            AssistantORM.assistant_id == assistant_id,
-            or_(
-                AssistantORM.user_id == user_identity, AssistantORM.user_id == "system"
-            ),
-        )
-        assistant = await self.session.scalar(stmt)
-
-        if not assistant:
-            raise HTTPException(404, f"Assistant '{assistant_id}' not found")
+        graph_id = await self._get_owned_graph_id(assistant_id, user_identity)
 
         try:
-            graph = await self.langgraph_service.get_graph(assistant.graph_id)
+            graph = await self.langgraph_service.get_graph(graph_id)
 
             try:
-                subgraphs = {
-                    ns: _extract_graph_schemas(subgraph)
+                # Materialize the subgraphs first, then extract all their
+                # schemas concurrently instead of one subgraph at a time
+                items = [
+                    (ns, subgraph)
                     async for ns, subgraph in graph.aget_subgraphs(
                         namespace=namespace, recurse=recurse
                     )
-                }
-                return subgraphs
+                ]
+                schemas = await asyncio.gather(
+                    *(_extract_graph_schemas(subgraph) for _, subgraph in items)
+                )
+                return {ns: schema for (ns, _), schema in zip(items, schemas)}
             except NotImplementedError as e:
                 raise HTTPException(
                     422, detail="The graph does not support subgraphs"
@@ -27,6 +27,10 @@ class LangGraphService:
         self.config: dict[str, Any] | None = None
         self._graph_registry: dict[str, Any] = {}
         self._graph_cache: dict[str, Any] = {}
+        # Valid graph ids, frozen once the registry is loaded at startup.
+        # Graphs only change via aegra.json, so hot paths can do an O(1)
+        # membership test instead of rebuilding the list_graphs() dict.
+        self.available_graph_ids: frozenset[str] = frozenset()
 
     async def initialize(self):
         """Load configuration file and setup graph registry.
@@ -86,6 +90,8 @@ class LangGraphService:
                 "export_name": export_name,
             }
 
+        self.available_graph_ids = frozenset(self._graph_registry)
+
     async def _ensure_default_assistants(self) -> None:
         """Create a default assistant per graph with deterministic UUID.
 
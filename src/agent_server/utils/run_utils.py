@@ -1,4 +1,3 @@
-import copy
 from typing import Any
 
 import structlog
@@ -6,32 +5,41 @@ import structlog
 logger = structlog.getLogger(__name__)
 
 
+_NOSTREAM_TAG = "langsmith:nostream"
+
+
 def _should_skip_event(raw_event: Any) -> bool:
-    """Check if an event should be skipped based on langsmith:nostream tag"""
-    try:
-        # Check if the event has metadata with tags containing 'langsmith:nostream'
-        if isinstance(raw_event, tuple) and len(raw_event) >= 2:
-            # For tuple events, check the third element (metadata tuple)
-            metadata_tuple = raw_event[len(raw_event) - 1]
-            if isinstance(metadata_tuple, tuple) and len(metadata_tuple) >= 2:
-                # Get the second item in the metadata tuple
-                metadata = metadata_tuple[1]
-                if isinstance(metadata, dict) and "tags" in metadata:
-                    tags = metadata["tags"]
-                    if isinstance(tags, list) and "langsmith:nostream" in tags:
-                        return True
+    """Check if an event should be skipped based on langsmith:nostream tag.
+
+    Runs once per streamed event, so it is written as plain early-return
+    type checks: every malformed shape falls through to False without the
+    try/except scaffolding the old version paid for on the happy path.
+    """
+    if type(raw_event) is not tuple or len(raw_event) < 2:
         return False
-    except Exception:
-        # If we can't parse the event structure, don't skip it
+    # For tuple events the metadata tuple is the last element
+    metadata_tuple = raw_event[-1]
+    if type(metadata_tuple) is not tuple or len(metadata_tuple) < 2:
         return False
+    metadata = metadata_tuple[1]
+    if type(metadata) is not dict:
+        return False
+    tags = metadata.get("tags")
+    return type(tags) is list and _NOSTREAM_TAG in tags
 
 
 def _merge_jsonb(*objects: dict) -> dict:
-    """Mimics PostgreSQL's JSONB merge behavior"""
-    result = {}
+    """Mimics PostgreSQL's JSONB merge behavior.
+
+    Returns a new top-level dict; nested values are shared with the inputs,
+    not deep-copied. Callers only read the merged result (it goes straight
+    into run configs / DB writes), so copying every nested structure per
+    call was pure allocation overhead.
+    """
+    result: dict = {}
     for obj in objects:
-        if obj is not None:
-            result.update(copy.deepcopy(obj))
+        if obj:
+            result.update(obj)
     return result
 
 
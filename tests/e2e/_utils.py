@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 
@@ -9,8 +10,16 @@ except Exception as e:
     ) from e
 
 
+# Checked once at import; set AEGRA_E2E_ELOG=0 to silence e2e logging. Hot
+# stream loops should also guard their elog calls with this flag so the
+# payload dicts are never built when logging is off.
+ELOG_ENABLED = os.environ.get("AEGRA_E2E_ELOG", "1") != "0"
+
+
 def elog(title: str, payload):
     """Emit pretty JSON logs for E2E visibility."""
+    if not ELOG_ENABLED:
+        return
     try:
         formatted = json.dumps(payload, ensure_ascii=False, indent=2, default=str)
     except Exception:
@@ -18,8 +27,77 @@ def elog(title: str, payload):
     print(f"\n=== {title} ===\n{formatted}\n")
 
 
-def get_e2e_client():
-    """Construct a LangGraph SDK client from env and log the target URL."""
+def get_e2e_client(*, http2: bool = False):
+    """Construct a LangGraph SDK client from env and log the target URL.
+
+    Pass http2=True to multiplex SDK requests over one connection when the
+    server speaks HTTP/2 (requires the h2 extra; cleartext servers fall
+    back to HTTP/1.1).
+    """
     server_url = os.getenv("SERVER_URL", "http://localhost:8000")
     print(f"[E2E] Using SERVER_URL={server_url}")
+    if http2:
+        # get_client() has no http2 knob, so build the underlying httpx
+        # client ourselves with the SDK's default timeouts
+        import httpx
+        from langgraph_sdk.client import LangGraphClient
+
+        return LangGraphClient(
+            httpx.AsyncClient(
+                base_url=server_url,
+                http2=True,
+                timeout=httpx.Timeout(connect=5, read=300, write=300, pool=5),
+            )
+        )
     return get_client(url=server_url)
+
+
+async def drain_batch(stream, max_items: int, timeout: float = 0.05) -> list:
+    """Pull up to max_items chunks from an async stream in one batch.
+
+    Keeps reading while the next chunk arrives within ``timeout`` seconds,
+    so already-buffered events are consumed in a single scheduling quantum
+    instead of one event-loop tick per ``async for`` iteration. Returns
+    whatever was collected when the stream goes quiet or ends.
+    """
+    iterator = stream.__aiter__()
+    items: list = []
+    while len(items) < max_items:
+        try:
+            items.append(await asyncio.wait_for(iterator.__anext__(), timeout))
+        except (TimeoutError, StopAsyncIteration):
+            break
+    return items
+
+
+async def wait_for_interrupt(client, thread_id: str, run_id: str, timeout: float = 10):
+    """Wait for a run to reach the interrupt by following its event stream.
+
+    Opens a single ``join_stream`` subscription and waits until a ``values``
+    chunk carries ``__interrupt__`` (or the stream ends), instead of polling
+    ``runs.get`` on a fixed interval. The server only writes
+    status="interrupted" after its stream loop exits, while the interrupt
+    event is broadcast from inside that loop, so after the event a short
+    poll waits for the status to leave "running". Returns the run so
+    callers can inspect its final status.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+
+    async def _consume():
+        async for chunk in client.runs.join_stream(
+            thread_id, run_id, stream_mode=["values"]
+        ):
+            data = getattr(chunk, "data", None)
+            if isinstance(data, dict) and data.get("__interrupt__"):
+                return
+
+    try:
+        await asyncio.wait_for(_consume(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+    run = await client.runs.get(thread_id, run_id)
+    while run["status"] == "running" and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.1)
+        run = await client.runs.get(thread_id, run_id)
+    return run
@@ -3,5 +3,34 @@
 E2E tests use the full system with real database and services.
 """
 
+import pytest_asyncio
+
+from tests.e2e._utils import get_e2e_client
 
 # Add E2E-test specific fixtures here (e.g., full app setup, real DB)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def agent_hitl_assistant_id() -> str:
+    """Create the agent_hitl assistant once per session and share its id.
+
+    assistants.create with if_exists="do_nothing" is idempotent, so per-test
+    creation only added a network round trip per test.
+    """
+    client = get_e2e_client()
+    assistant = await client.assistants.create(
+        graph_id="agent_hitl",
+        if_exists="do_nothing",
+    )
+    return assistant["assistant_id"]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def subgraph_assistant_id() -> str:
+    """Create the subgraph_agent assistant once per session and share its id."""
+    client = get_e2e_client()
+    assistant = await client.assistants.create(
+        graph_id="subgraph_agent",
+        if_exists="do_nothing",
+    )
+    return assistant["assistant_id"]
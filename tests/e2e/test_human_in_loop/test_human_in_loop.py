@@ -1,28 +1,27 @@
+from operator import attrgetter
+
 import pytest
 
-from tests.e2e._utils import elog, get_e2e_client
+from tests.e2e._utils import elog, get_e2e_client, wait_for_interrupt
+
+# Bound once so the hot stream loops below do a single attribute fetch per
+# chunk instead of repeated getattr calls.
+_chunk_event = attrgetter("event")
+_chunk_data = attrgetter("data")
 
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_human_in_loop_interrupt_resume_e2e():
+async def test_human_in_loop_interrupt_resume_e2e(agent_hitl_assistant_id):
     """
     Complete human-in-the-loop test using agent_hitl graph (non-streaming).
     Tests: interrupt detection, validation, resume with approval, tool execution.
     """
     client = get_e2e_client()
 
-    # Create assistant with agent_hitl graph
-    assistant = await client.assistants.create(
-        graph_id="agent_hitl",
-        config={"tags": ["hitl", "complete_cycle"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create (agent_hitl)", assistant)
-    assert "assistant_id" in assistant
-    assistant_id = assistant["assistant_id"]
-
-    # Create thread
+    # Assistant comes from the session-scoped agent_hitl fixture; only the
+    # thread is created per test.
+    assistant_id = agent_hitl_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
@@ -53,23 +52,11 @@ async def test_human_in_loop_interrupt_resume_e2e():
     elog("Runs.create (tool trigger)", run)
     run_id = run["run_id"]
 
-    # Wait for interrupt
-    import asyncio
-
-    max_wait = 10
-    wait_interval = 0.5
-    waited = 0
-
-    while waited < max_wait:
-        await asyncio.sleep(wait_interval)
-        waited += wait_interval
-
-        interrupted_run = await client.runs.get(thread_id, run_id)
-        if interrupted_run["status"] == "interrupted":
-            break
-        elif interrupted_run["status"] in ("completed", "failed", "error"):
-            elog("Run completed without interrupt", interrupted_run)
-            return
+    # Wait for interrupt via the run's event stream (no fixed-interval polling)
+    interrupted_run = await wait_for_interrupt(client, thread_id, run_id, timeout=10)
+    if interrupted_run["status"] in ("completed", "failed", "error"):
+        elog("Run completed without interrupt", interrupted_run)
+        return
 
     assert interrupted_run["status"] == "interrupted", (
         f"Expected interrupted, got {interrupted_run['status']}"
@@ -138,24 +125,16 @@ async def test_human_in_loop_interrupt_resume_e2e():
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_human_in_loop_text_response_e2e():
+async def test_human_in_loop_text_response_e2e(agent_hitl_assistant_id):
     """
     Test human-in-the-loop text response flow using agent_hitl graph.
     Tests: interrupt detection, text response, human message addition, conversation continuation.
     """
     client = get_e2e_client()
 
-    # Create assistant with agent_hitl graph
-    assistant = await client.assistants.create(
-        graph_id="agent_hitl",
-        config={"tags": ["hitl", "rejection"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create (agent_hitl)", assistant)
-    assert "assistant_id" in assistant
-    assistant_id = assistant["assistant_id"]
-
-    # Create thread
+    # Assistant comes from the session-scoped agent_hitl fixture; only the
+    # thread is created per test.
+    assistant_id = agent_hitl_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
@@ -171,23 +150,11 @@ async def test_human_in_loop_text_response_e2e():
     elog("Runs.create (tool trigger)", run)
     run_id = run["run_id"]
 
-    # Wait for interrupt
-    import asyncio
-
-    max_wait = 10
-    wait_interval = 0.5
-    waited = 0
-
-    while waited < max_wait:
-        await asyncio.sleep(wait_interval)
-        waited += wait_interval
-
-        interrupted_run = await client.runs.get(thread_id, run_id)
-        if interrupted_run["status"] == "interrupted":
-            break
-        elif interrupted_run["status"] in ("completed", "failed", "error"):
-            elog("Run completed without interrupt", interrupted_run)
-            return
+    # Wait for interrupt via the run's event stream (no fixed-interval polling)
+    interrupted_run = await wait_for_interrupt(client, thread_id, run_id, timeout=10)
+    if interrupted_run["status"] in ("completed", "failed", "error"):
+        elog("Run completed without interrupt", interrupted_run)
+        return
 
     assert interrupted_run["status"] == "interrupted", (
         f"Expected interrupted, got {interrupted_run['status']}"
@@ -287,24 +254,16 @@ async def test_human_in_loop_text_response_e2e():
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_human_in_loop_ignore_tool_call_e2e():
+async def test_human_in_loop_ignore_tool_call_e2e(agent_hitl_assistant_id):
     """
     Test human-in-the-loop ignore flow using agent_hitl graph.
     Tests: interrupt detection, ignore response, no tool execution.
     """
     client = get_e2e_client()
 
-    # Create assistant with agent_hitl graph
-    assistant = await client.assistants.create(
-        graph_id="agent_hitl",
-        config={"tags": ["hitl", "ignore"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create (agent_hitl)", assistant)
-    assert "assistant_id" in assistant
-    assistant_id = assistant["assistant_id"]
-
-    # Create thread
+    # Assistant comes from the session-scoped agent_hitl fixture; only the
+    # thread is created per test.
+    assistant_id = agent_hitl_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
@@ -320,23 +279,11 @@ async def test_human_in_loop_ignore_tool_call_e2e():
     elog("Runs.create (tool trigger)", run)
     run_id = run["run_id"]
 
-    # Wait for interrupt
-    import asyncio
-
-    max_wait = 10
-    wait_interval = 0.5
-    waited = 0
-
-    while waited < max_wait:
-        await asyncio.sleep(wait_interval)
-        waited += wait_interval
-
-        interrupted_run = await client.runs.get(thread_id, run_id)
-        if interrupted_run["status"] == "interrupted":
-            break
-        elif interrupted_run["status"] in ("completed", "failed", "error"):
-            elog("Run completed without interrupt", interrupted_run)
-            return
+    # Wait for interrupt via the run's event stream (no fixed-interval polling)
+    interrupted_run = await wait_for_interrupt(client, thread_id, run_id, timeout=10)
+    if interrupted_run["status"] in ("completed", "failed", "error"):
+        elog("Run completed without interrupt", interrupted_run)
+        return
 
     assert interrupted_run["status"] == "interrupted", (
         f"Expected interrupted, got {interrupted_run['status']}"
@@ -410,24 +357,16 @@ async def test_human_in_loop_ignore_tool_call_e2e():
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_human_in_loop_edit_tool_args_e2e():
+async def test_human_in_loop_edit_tool_args_e2e(agent_hitl_assistant_id):
     """
     Test human-in-the-loop edit functionality using agent_hitl graph.
     Tests: interrupt detection, argument editing, tool execution with modified args.
     """
     client = get_e2e_client()
 
-    # Create assistant with agent_hitl graph
-    assistant = await client.assistants.create(
-        graph_id="agent_hitl",
-        config={"tags": ["hitl", "edit"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create (agent_hitl)", assistant)
-    assert "assistant_id" in assistant
-    assistant_id = assistant["assistant_id"]
-
-    # Create thread
+    # Assistant comes from the session-scoped agent_hitl fixture; only the
+    # thread is created per test.
+    assistant_id = agent_hitl_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
@@ -445,23 +384,11 @@ async def test_human_in_loop_edit_tool_args_e2e():
     elog("Runs.create (tool trigger)", run)
     run_id = run["run_id"]
 
-    # Wait for interrupt
-    import asyncio
-
-    max_wait = 10
-    wait_interval = 0.5
-    waited = 0
-
-    while waited < max_wait:
-        await asyncio.sleep(wait_interval)
-        waited += wait_interval
-
-        interrupted_run = await client.runs.get(thread_id, run_id)
-        if interrupted_run["status"] == "interrupted":
-            break
-        elif interrupted_run["status"] in ("completed", "failed", "error"):
-            elog("Run completed without interrupt", interrupted_run)
-            return
+    # Wait for interrupt via the run's event stream (no fixed-interval polling)
+    interrupted_run = await wait_for_interrupt(client, thread_id, run_id, timeout=10)
+    if interrupted_run["status"] in ("completed", "failed", "error"):
+        elog("Run completed without interrupt", interrupted_run)
+        return
 
     assert interrupted_run["status"] == "interrupted", (
         f"Expected interrupted, got {interrupted_run['status']}"
@@ -555,7 +482,7 @@ async def test_human_in_loop_edit_tool_args_e2e():
 )
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_human_in_loop_mark_as_resolved_e2e():
+async def test_human_in_loop_mark_as_resolved_e2e(agent_hitl_assistant_id):
     """
     Test human-in-the-loop "Mark as Resolved" functionality using agent_hitl graph.
     Tests: interrupt detection, mark as resolved command, direct termination.
@@ -564,17 +491,9 @@ async def test_human_in_loop_mark_as_resolved_e2e():
     """
     client = get_e2e_client()
 
-    # Create assistant with agent_hitl graph
-    assistant = await client.assistants.create(
-        graph_id="agent_hitl",
-        config={"tags": ["hitl", "resolve"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create (agent_hitl)", assistant)
-    assert "assistant_id" in assistant
-    assistant_id = assistant["assistant_id"]
-
-    # Create thread
+    # Assistant comes from the session-scoped agent_hitl fixture; only the
+    # thread is created per test.
+    assistant_id = agent_hitl_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
@@ -590,23 +509,11 @@ async def test_human_in_loop_mark_as_resolved_e2e():
     elog("Runs.create (tool trigger)", run)
     run_id = run["run_id"]
 
-    # Wait for interrupt
-    import asyncio
-
-    max_wait = 10
-    wait_interval = 0.5
-    waited = 0
-
-    while waited < max_wait:
-        await asyncio.sleep(wait_interval)
-        waited += wait_interval
-
-        interrupted_run = await client.runs.get(thread_id, run_id)
-        if interrupted_run["status"] == "interrupted":
-            break
-        elif interrupted_run["status"] in ("completed", "failed", "error"):
-            elog("Run completed without interrupt", interrupted_run)
-            return
+    # Wait for interrupt via the run's event stream (no fixed-interval polling)
+    interrupted_run = await wait_for_interrupt(client, thread_id, run_id, timeout=10)
+    if interrupted_run["status"] in ("completed", "failed", "error"):
+        elog("Run completed without interrupt", interrupted_run)
+        return
 
     assert interrupted_run["status"] == "interrupted", (
         f"Expected interrupted, got {interrupted_run['status']}"
@@ -657,22 +564,17 @@ async def test_human_in_loop_mark_as_resolved_e2e():
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_human_in_loop_streaming_interrupt_resume_e2e():
+async def test_human_in_loop_streaming_interrupt_resume_e2e(agent_hitl_assistant_id):
     """
     Complete streaming human-in-the-loop test using agent_hitl graph.
     Tests: real-time interrupt detection, streaming resume, tool execution verification.
     """
     client = get_e2e_client()
 
-    # Setup
-    assistant = await client.assistants.create(
-        graph_id="agent_hitl",
-        config={"tags": ["hitl", "streaming"]},
-        if_exists="do_nothing",
-    )
+    # Setup: assistant comes from the session-scoped agent_hitl fixture
+    assistant_id = agent_hitl_assistant_id
     thread = await client.threads.create()
     thread_id = thread["thread_id"]
-    assistant_id = assistant["assistant_id"]
 
     # Phase 1: Stream until interrupt
     elog("Phase 1: Stream until interrupt", {"starting": True})
@@ -693,19 +595,14 @@ async def test_human_in_loop_streaming_interrupt_resume_e2e():
 
     async for chunk in stream:
         event_count += 1
-        event_type = getattr(chunk, "event", None)
-        data = getattr(chunk, "data", None)
 
         # Look for interrupt in values events
-        if (
-            event_type == "values"
-            and isinstance(data, dict)
-            and "__interrupt__" in data
-            and len(data.get("__interrupt__", [])) > 0
-        ):
-            interrupt_detected = True
-            elog("✅ Interrupt detected in stream!", {"event_count": event_count})
-            break
+        if _chunk_event(chunk) == "values":
+            data = _chunk_data(chunk)
+            if isinstance(data, dict) and data.get("__interrupt__"):
+                interrupt_detected = True
+                elog("✅ Interrupt detected in stream!", {"event_count": event_count})
+                break
 
         if event_count > 50:  # Safety limit
             break
@@ -743,25 +640,25 @@ async def test_human_in_loop_streaming_interrupt_resume_e2e():
 
     async for chunk in resume_stream:
         resume_event_count += 1
-        event_type = getattr(chunk, "event", None)
-        data = getattr(chunk, "data", None)
 
         # Look for tool execution and final AI response
-        if event_type == "values" and isinstance(data, dict):
-            messages = data.get("messages", [])
-            for msg in messages:
-                if isinstance(msg, dict):
-                    if msg.get("type") == "tool":
-                        tool_executed = True
-                        elog("✅ Tool execution detected!", {"tool": msg.get("name")})
-                    elif (
-                        msg.get("type") == "ai" and msg.get("content") and tool_executed
-                    ):
-                        final_ai_message = True
-                        elog(
-                            "✅ Final AI response!",
-                            {"length": len(msg.get("content", ""))},
-                        )
+        if _chunk_event(chunk) == "values":
+            data = _chunk_data(chunk)
+            if not isinstance(data, dict):
+                continue
+            for msg in data.get("messages", ()):
+                if not isinstance(msg, dict):
+                    continue
+                msg_get = msg.get
+                if msg_get("type") == "tool":
+                    tool_executed = True
+                    elog("✅ Tool execution detected!", {"tool": msg_get("name")})
+                elif msg_get("type") == "ai" and msg_get("content") and tool_executed:
+                    final_ai_message = True
+                    elog(
+                        "✅ Final AI response!",
+                        {"length": len(msg_get("content", ""))},
+                    )
 
         if resume_event_count > 50:  # Safety limit
             break
@@ -0,0 +1,59 @@
+"""Run e2e test specific fixtures"""
+
+import os
+
+import httpx
+import pytest_asyncio
+from httpx import AsyncClient
+
+from tests.e2e._utils import get_e2e_client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def e2e_client():
+    """Share one SDK client (and its connection pool) across the module.
+
+    Constructing the client per test rebuilt the underlying httpx pool
+    each time; module scope keeps connections warm between tests.
+    """
+    client = get_e2e_client()
+    try:
+        yield client
+    finally:
+        # The SDK wraps an httpx.AsyncClient; close it if reachable
+        inner = getattr(getattr(client, "http", None), "client", None)
+        if inner is not None:
+            await inner.aclose()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shared_assistant_id(e2e_client) -> str:
+    """Create the shared agent assistant once per module.
+
+    Every run test needs an assistant for graph_id=agent; creating it
+    per test cost a round trip and DB lookup each time even on the
+    if_exists="do_nothing" path.
+    """
+    assistant = await e2e_client.assistants.create(
+        graph_id="agent",
+        config={"tags": ["chat", "runs-shared"]},
+        if_exists="do_nothing",
+    )
+    return assistant["assistant_id"]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def http_client():
+    """Share one AsyncClient (and its keep-alive pool) across a module.
+
+    Opening a fresh client per test paid connection setup for every raw
+    HTTP call; a module-scoped client reuses pooled connections instead.
+    """
+    base_url = os.getenv("AEGRA_BASE_URL", "http://localhost:8000")
+    limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+    # http2=True multiplexes requests over one connection against HTTP/2
+    # servers; cleartext HTTP/1.1 servers are negotiated transparently
+    async with AsyncClient(
+        base_url=base_url, timeout=120.0, limits=limits, http2=True
+    ) as client:
+        yield client
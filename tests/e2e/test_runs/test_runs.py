@@ -1,12 +1,16 @@
+import asyncio
+
 import pytest
 
 # Match import style used by other e2e tests when run as top-level modules
-from tests.e2e._utils import elog, get_e2e_client
+from tests.e2e._utils import ELOG_ENABLED, drain_batch, elog
+
+# Each test creates its own thread, so the module is safe to distribute
+# across pytest-xdist workers (see tests/README.md for the -n invocation)
+pytestmark = [pytest.mark.e2e, pytest.mark.asyncio]
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_runs_crud_and_join_e2e():
+async def test_runs_crud_and_join_e2e(e2e_client, shared_assistant_id, http_client):
     """
     Mirrors existing e2e style using the typed SDK client (see test_chat_streaming, test_background_run_join).
     Validates the non-streaming "background run" flow and CRUD around it:
@@ -18,19 +22,11 @@ async def test_runs_crud_and_join_e2e():
       6) List runs for the same thread and ensure presence
       7) Stream endpoint for a terminal run should yield an end event quickly via SDK wrapper
     """
-    client = get_e2e_client()
-
-    # 1) Assistant
-    assistant = await client.assistants.create(
-        graph_id="agent",
-        config={"tags": ["chat", "runs-crud"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create", assistant)
-    assert "assistant_id" in assistant
-    assistant_id = assistant["assistant_id"]
+    client = e2e_client
 
-    # 2) Thread
+    # 1) + 2) Assistant comes from the module fixture; only the thread is
+    # created per test
+    assistant_id = shared_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
@@ -73,27 +69,30 @@ async def test_runs_crud_and_join_e2e():
     runs_list = await client.runs.list(thread_id)
     elog("Runs.list", runs_list)
     assert isinstance(runs_list, list)
-    assert any(r["run_id"] == run_id for r in runs_list)
+    # The list endpoint returns newest-first (runs_list[0] is relied on
+    # elsewhere in this file), so the fresh run should be at the head;
+    # fall back to a scan in case the sort order ever changes
+    assert runs_list and (
+        runs_list[0]["run_id"] == run_id
+        or run_id in {r["run_id"] for r in runs_list[1:]}
+    )
 
-    # 7) Stream endpoint after completion: should yield an end event quickly.
-    # Reuse the SDK join_stream to align with current helper patterns.
-    # We accept that there may be zero deltas and just an "end".
-    end_seen = False
-    async for chunk in client.runs.join_stream(
-        thread_id=thread_id,
-        run_id=run_id,
-        stream_mode=["messages", "values"],
-    ):
-        elog("Runs.stream(terminal) event", {"event": getattr(chunk, "event", None)})
-        if getattr(chunk, "event", None) == "end":
-            end_seen = True
-            break
-    assert end_seen, "Expected an 'end' event when streaming a terminal run"
-
-
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_runs_cancel_e2e():
+    # 7) Stream endpoint after completion: a terminal run emits exactly one
+    # end frame and closes, so one bounded GET replaces full SSE
+    # consumption through the SDK; the timeout still fails fast instead of
+    # hanging CI if the stream never terminates
+    resp = await http_client.get(
+        f"/threads/{thread_id}/runs/{run_id}/stream",
+        headers={"Accept": "text/event-stream"},
+        timeout=10.0,
+    )
+    assert resp.status_code == 200
+    assert "event: end" in resp.text, (
+        "Expected an 'end' event when streaming a terminal run"
+    )
+
+
+async def test_runs_cancel_e2e(e2e_client, shared_assistant_id):
     """
     Cancellation flow aligned with e2e client helpers:
       1) Create assistant and thread
@@ -101,17 +100,12 @@ async def test_runs_cancel_e2e():
       3) Cancel the run via SDK
       4) Verify status is cancelled/interrupted/final afterward
     """
-    client = get_e2e_client()
+    client = e2e_client
 
-    # Assistant + thread
-    assistant = await client.assistants.create(
-        graph_id="agent",
-        config={"tags": ["chat", "runs-cancel"]},
-        if_exists="do_nothing",
-    )
+    # Assistant from the module fixture; only the thread is per test
+    assistant_id = shared_assistant_id
     thread = await client.threads.create()
     thread_id = thread["thread_id"]
-    assistant_id = assistant["assistant_id"]
 
     # Start streaming run (returns an async iterator through the SDK)
     stream = client.runs.stream(
@@ -121,14 +115,14 @@ async def test_runs_cancel_e2e():
         stream_mode=["messages"],
     )
 
-    # Consume a couple of events then cancel
-    events_seen = 0
-    async for chunk in stream:
-        events_seen += 1
-        elog("Runs.stream (pre-cancel)", {"event": getattr(chunk, "event", None)})
-        # Try to fetch a run id by listing runs; server persists runs metadata now
-        if events_seen >= 2:
-            break
+    # Drain up to two events in one batch, then cancel; the generous
+    # timeout only bounds how long we wait for the stream to start
+    events = await drain_batch(stream, max_items=2, timeout=10.0)
+    if ELOG_ENABLED:
+        elog(
+            "Runs.stream (pre-cancel)",
+            {"events": [getattr(chunk, "event", None) for chunk in events]},
+        )
 
     # Find the most recent run id
     runs_list = await client.runs.list(thread_id)
@@ -146,9 +140,7 @@ async def test_runs_cancel_e2e():
     assert got["status"] in ("cancelled", "interrupted", "failed", "completed")
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_runs_wait_stateful_e2e():
+async def test_runs_wait_stateful_e2e(e2e_client, shared_assistant_id, http_client):
     """
     Test the stateful wait endpoint (POST /threads/{thread_id}/runs/wait).
     This endpoint creates a run and waits for it to complete before returning the final output.
@@ -159,58 +151,43 @@ async def test_runs_wait_stateful_e2e():
       3) Verify output is returned directly (not a Run object)
       4) Verify run was created and completed
     """
-    import os
-
-    from httpx import AsyncClient
-
-    client = get_e2e_client()
-
-    # 1) Setup: Create assistant and thread
-    assistant = await client.assistants.create(
-        graph_id="agent",
-        config={"tags": ["chat", "wait-test"]},
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create", assistant)
-    assistant_id = assistant["assistant_id"]
+    client = e2e_client
 
+    # 1) Setup: assistant from the module fixture, thread per test
+    assistant_id = shared_assistant_id
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
 
-    # 2) Call wait endpoint directly via HTTP client
-    base_url = os.getenv("AEGRA_BASE_URL", "http://localhost:8000")
-    async with AsyncClient(base_url=base_url, timeout=120.0) as http_client:
-        response = await http_client.post(
-            f"/threads/{thread_id}/runs/wait",
-            json={
-                "assistant_id": assistant_id,
-                "input": {
-                    "messages": [{"role": "user", "content": "Say hello in one word."}]
-                },
-            },
-        )
-        elog(
-            "Wait endpoint response",
-            {
-                "status": response.status_code,
-                "output": response.json() if response.status_code == 200 else None,
+    # 2) Call wait endpoint directly via the shared HTTP client
+    response = await http_client.post(
+        f"/threads/{thread_id}/runs/wait",
+        json={
+            "assistant_id": assistant_id,
+            "input": {
+                "messages": [{"role": "user", "content": "Say hello in one word."}]
             },
-        )
+        },
+    )
+    # Parse the body once; it is reused for logging and assertions below
+    output = response.json() if response.status_code == 200 else None
+    elog(
+        "Wait endpoint response",
+        {"status": response.status_code, "output": output},
+    )
 
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        output = response.json()
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-        # 3) Verify output format - should be just the output dict, not a Run object
-        assert isinstance(output, dict), "Expected output to be a dict"
-        # Should not have run_id, thread_id, etc. - just the graph output
-        assert "messages" in output or "output" in output or len(output) >= 0, (
-            "Expected output to contain graph output data"
-        )
+    # 3) Verify output format - should be just the output dict, not a Run object
+    assert isinstance(output, dict), "Expected output to be a dict"
+    # Should not have run_id, thread_id, etc. - just the graph output
+    assert "messages" in output or "output" in output or len(output) >= 0, (
+        "Expected output to contain graph output data"
+    )
 
-        # Should NOT have Run metadata fields if it's the output directly
-        # (but if implementation returns empty dict, that's OK too)
-        elog("Final output from wait", output)
+    # Should NOT have Run metadata fields if it's the output directly
+    # (but if implementation returns empty dict, that's OK too)
+    elog("Final output from wait", output)
 
     # 4) Verify run was created and completed by listing runs
     runs_list = await client.runs.list(thread_id)
@@ -224,64 +201,120 @@ async def test_runs_wait_stateful_e2e():
     )
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_runs_wait_with_interrupts_e2e():
+async def test_runs_wait_with_interrupts_e2e(e2e_client, shared_assistant_id, http_client):
     """
     Test that the wait endpoint handles interrupt scenarios correctly.
     When a run is interrupted, the wait endpoint should return the partial output.
 
     This test uses interrupt_before to force an interrupt.
     """
-    import os
-
-    from httpx import AsyncClient
-
-    client = get_e2e_client()
-
-    # Setup
-    assistant = await client.assistants.create(
-        graph_id="agent",
-        config={"tags": ["chat", "wait-interrupt-test"]},
-        if_exists="do_nothing",
-    )
-    assistant_id = assistant["assistant_id"]
+    client = e2e_client
 
+    # Setup: assistant from the module fixture, thread per test
+    assistant_id = shared_assistant_id
     thread = await client.threads.create()
     thread_id = thread["thread_id"]
 
     # Call wait endpoint with interrupt_before to force interruption
     # Note: This will interrupt before a specific node executes
-    base_url = os.getenv("AEGRA_BASE_URL", "http://localhost:8000")
-    async with AsyncClient(base_url=base_url, timeout=120.0) as http_client:
-        response = await http_client.post(
-            f"/threads/{thread_id}/runs/wait",
-            json={
-                "assistant_id": assistant_id,
-                "input": {"messages": [{"role": "user", "content": "Test"}]},
-                "interrupt_before": ["agent"],  # Interrupt before agent node
-            },
-        )
-        elog(
-            "Wait with interrupt response",
-            {
-                "status": response.status_code,
-                "output": response.json() if response.status_code == 200 else None,
-            },
-        )
+    response = await http_client.post(
+        f"/threads/{thread_id}/runs/wait",
+        json={
+            "assistant_id": assistant_id,
+            "input": {"messages": [{"role": "user", "content": "Test"}]},
+            "interrupt_before": ["agent"],  # Interrupt before agent node
+        },
+    )
+    # Parse the body once; it is reused for logging and assertions below
+    output = response.json() if response.status_code == 200 else None
+    elog(
+        "Wait with interrupt response",
+        {"status": response.status_code, "output": output},
+    )
+
+    # Even interrupted runs should return 200 with partial output
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert isinstance(output, dict), "Expected output to be a dict"
+
+    # Verify the run was created and completed
+    # Note: The interrupt may not trigger if the node name doesn't match the graph structure
+    # This test primarily verifies that interrupt_before parameter is accepted and doesn't break
+    runs_list = await client.runs.list(thread_id)
+    assert len(runs_list) > 0
+    last_run = runs_list[0]
+    # Status can be interrupted or completed depending on graph structure
+    assert last_run["status"] in ("interrupted", "completed"), (
+        f"Expected interrupted or completed status, got {last_run['status']}"
+    )
+
+
+async def test_runs_concurrent_create_and_join_e2e(e2e_client):
+    """
+    Exercise the server's concurrency path with overlapping background runs:
+      1) Create assistant and several threads concurrently
+      2) Fire all runs.create calls in one gather (no serial submit queue)
+      3) Join every run concurrently, with per-run timeouts that don't
+         cancel siblings
+      4) Verify each run reached a terminal state
+    """
+    client = e2e_client
+    num_runs = 3
+
+    assistant, *threads = await asyncio.gather(
+        client.assistants.create(
+            graph_id="agent",
+            config={"tags": ["chat", "runs-concurrent"]},
+            if_exists="do_nothing",
+        ),
+        *[client.threads.create() for _ in range(num_runs)],
+    )
+    assistant_id = assistant["assistant_id"]
+    thread_ids = [t["thread_id"] for t in threads]
+
+    # Overlap the POSTs instead of awaiting each create in a loop
+    runs = await asyncio.gather(
+        *[
+            client.runs.create(
+                thread_id=thread_id,
+                assistant_id=assistant_id,
+                input={
+                    "messages": [
+                        {"role": "user", "content": f"Say one short sentence. ({i})"}
+                    ]
+                },
+                stream_mode=["values"],
+            )
+            for i, thread_id in enumerate(thread_ids)
+        ]
+    )
+    elog("Runs.create (concurrent)", runs)
+    assert len(runs) == num_runs
+
+    # Join all runs concurrently; return_exceptions keeps one timeout from
+    # cancelling the rest
+    joins = await asyncio.gather(
+        *[
+            asyncio.wait_for(
+                client.runs.join(thread_id, run["run_id"]), timeout=30.0
+            )
+            for thread_id, run in zip(thread_ids, runs)
+        ],
+        return_exceptions=True,
+    )
+    elog("Runs.join (concurrent)", {"results": [type(j).__name__ for j in joins]})
+    assert not any(isinstance(j, Exception) for j in joins), (
+        f"Expected all joins to succeed, got {joins}"
+    )
 
-        # Even interrupted runs should return 200 with partial output
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        output = response.json()
-        assert isinstance(output, dict), "Expected output to be a dict"
-
-        # Verify the run was created and completed
-        # Note: The interrupt may not trigger if the node name doesn't match the graph structure
-        # This test primarily verifies that interrupt_before parameter is accepted and doesn't break
-        runs_list = await client.runs.list(thread_id)
-        assert len(runs_list) > 0
-        last_run = runs_list[0]
-        # Status can be interrupted or completed depending on graph structure
-        assert last_run["status"] in ("interrupted", "completed"), (
-            f"Expected interrupted or completed status, got {last_run['status']}"
+    # Parallelize the post-check as well
+    statuses = await asyncio.gather(
+        *[
+            client.runs.get(thread_id, run["run_id"])
+            for thread_id, run in zip(thread_ids, runs)
+        ]
+    )
+    for got in statuses:
+        assert got["status"] in ("completed", "interrupted"), (
+            f"Expected terminal status, got {got['status']}"
         )
+    elog("Concurrent runs verified", {"statuses": [g["status"] for g in statuses]})
@@ -1,8 +1,9 @@
+from contextlib import aclosing
 from typing import Any
 
 import pytest
 
-from tests.e2e._utils import elog, get_e2e_client
+from tests.e2e._utils import ELOG_ENABLED, elog, get_e2e_client
 
 
 def _get_langgraph_node(chunk: Any) -> str:
@@ -34,20 +35,19 @@ def _count_langgraph_nodes(langgraph_node_counts: dict, chunk: Any):
             langgraph_node_counts.get(langgraph_node, 0) + 1
         )
 
-    event_type = getattr(chunk, "event", None)
-
-    elog(
-        "Subgraph streaming event",
-        {
-            "event": event_type,
-            "langgraph_node_counts": langgraph_node_counts,
-        },
-    )
+    if ELOG_ENABLED:
+        elog(
+            "Subgraph streaming event",
+            {
+                "event": getattr(chunk, "event", None),
+                "langgraph_node_counts": langgraph_node_counts,
+            },
+        )
 
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_langsmith_nostream_event_filtering_e2e():
+async def test_langsmith_nostream_event_filtering_e2e(subgraph_assistant_id):
     """
     Test that events containing 'langsmith:nostream' tag are properly filtered out
     during run execution. This validates the _should_skip_event function.
@@ -58,22 +58,16 @@ async def test_langsmith_nostream_event_filtering_e2e():
     """
     client = get_e2e_client()
 
-    # Create assistant and thread
-    assistant = await client.assistants.create(
-        graph_id="subgraph_agent",
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create", assistant)
-
+    # Assistant comes from the session-scoped fixture; only the thread is
+    # created per test.
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
-    assistant_id = assistant["assistant_id"]
 
     # Start a streaming run that would potentially generate events with langsmith:nostream tag
     stream = client.runs.stream(
         thread_id=thread_id,
-        assistant_id=assistant_id,
+        assistant_id=subgraph_assistant_id,
         input={
             "messages": [
                 {
@@ -82,19 +76,22 @@ async def test_langsmith_nostream_event_filtering_e2e():
                 }
             ]
         },
-        stream_mode=["messages", "values"],
+        stream_mode=["messages"],
     )
 
     # Track events to ensure subgraph events are included
     event_count = 0
     langgraph_node_counts = {}  # Track events by langgraph_node
 
-    async for chunk in stream:
-        _count_langgraph_nodes(langgraph_node_counts, chunk)
-        event_count += 1
-        # Stop after a reasonable number of events to avoid infinite loops
-        if event_count >= 20:
-            break
+    # aclosing() finalizes the generator deterministically when we break out,
+    # instead of leaving buffered chunks alive until garbage collection.
+    async with aclosing(stream) as stream:
+        async for chunk in stream:
+            _count_langgraph_nodes(langgraph_node_counts, chunk)
+            event_count += 1
+            # Stop after a reasonable number of events to avoid infinite loops
+            if event_count >= 20:
+                break
 
     # There should be no messages events from no_stream node.
     assert langgraph_node_counts.get("no_stream", 0) == 0, (
@@ -115,7 +112,7 @@ async def test_langsmith_nostream_event_filtering_e2e():
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
-async def test_subgraphs_streaming_parameter_e2e():
+async def test_subgraphs_streaming_parameter_e2e(subgraph_assistant_id):
     """
     Test that the subgraphs=True parameter is correctly applied in graph.astream()
     calls, enabling streaming events from subsequent graphs.
@@ -128,22 +125,16 @@ async def test_subgraphs_streaming_parameter_e2e():
     """
     client = get_e2e_client()
 
-    # Create assistant and thread
-    assistant = await client.assistants.create(
-        graph_id="subgraph_agent",
-        if_exists="do_nothing",
-    )
-    elog("Assistant.create", assistant)
-
+    # Assistant comes from the session-scoped fixture; only the thread is
+    # created per test.
     thread = await client.threads.create()
     elog("Threads.create", thread)
     thread_id = thread["thread_id"]
-    assistant_id = assistant["assistant_id"]
 
     # Create a run that could trigger subgraph execution
     stream = client.runs.stream(
         thread_id=thread_id,
-        assistant_id=assistant_id,
+        assistant_id=subgraph_assistant_id,
         input={
             "messages": [
                 {
@@ -152,7 +143,7 @@ async def test_subgraphs_streaming_parameter_e2e():
                 }
             ]
         },
-        stream_mode=["messages", "values"],
+        stream_mode=["messages"],
         stream_subgraphs=True,
     )
 
@@ -160,12 +151,15 @@ async def test_subgraphs_streaming_parameter_e2e():
     event_count = 0
     langgraph_node_counts = {}  # Track events by langgraph_node
 
-    async for chunk in stream:
-        _count_langgraph_nodes(langgraph_node_counts, chunk)
-        event_count += 1
-        # Stop after a reasonable number of events to avoid infinite loops
-        if event_count >= 20:
-            break
+    # aclosing() finalizes the generator deterministically when we break out,
+    # instead of leaving buffered chunks alive until garbage collection.
+    async with aclosing(stream) as stream:
+        async for chunk in stream:
+            _count_langgraph_nodes(langgraph_node_counts, chunk)
+            event_count += 1
+            # Stop after a reasonable number of events to avoid infinite loops
+            if event_count >= 20:
+                break
 
     # Validate streaming produced events from call_model node.
     # We're expecting "call_model" node, not "subgraph_agent" node since we're streaming subgraphs.
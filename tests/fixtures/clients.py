@@ -1,5 +1,6 @@
 """Test client fixtures"""
 
+import httpx
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -38,3 +39,14 @@ def create_test_app(include_runs: bool = True, include_threads: bool = True) ->
 def make_client(app: FastAPI) -> TestClient:
     """Create a test client for the given app"""
     return TestClient(app)
+
+
+def make_async_client(app: FastAPI) -> httpx.AsyncClient:
+    """Create an in-process async client for the given app.
+
+    Talks to the app through httpx's ASGITransport on the test's own event
+    loop, so requests skip the worker thread + portal hop TestClient pays.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
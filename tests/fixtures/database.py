@@ -2,6 +2,21 @@
 
 from collections.abc import AsyncIterator, Callable
 
+# Distinguishes "not stubbed" from an explicit None result in make_session
+_UNSET = object()
+
+
+class ScalarsResult:
+    """Minimal stand-in for the result of AsyncSession.scalars()"""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
 
 class DummySessionBase:
     """Minimal emulation of SQLAlchemy AsyncSession for testing
@@ -30,11 +45,37 @@ class DummySessionBase:
         return None
 
     async def scalars(self, _stmt):
-        class Result:
-            def all(self_inner):
-                return []
+        return ScalarsResult([])
+
+
+def make_session(*, scalar=_UNSET, scalars=_UNSET, execute=False) -> DummySessionBase:
+    """Build a stubbed session without declaring a subclass per test
+
+    scalar: row returned by session.scalar() (an explicit None means "not
+    found"). scalars: list of rows returned by session.scalars().all().
+    execute: when True, session.execute() becomes an accepted no-op.
+    """
+    session = DummySessionBase()
+    if scalar is not _UNSET:
+
+        async def _scalar(_stmt, _row=scalar):
+            return _row
+
+        session.scalar = _scalar
+    if scalars is not _UNSET:
+        result = ScalarsResult(scalars)
+
+        async def _scalars(_stmt, _result=result):
+            return _result
+
+        session.scalars = _scalars
+    if execute:
+
+        async def _execute(_stmt):
+            return None
 
-        return Result()
+        session.execute = _execute
+    return session
 
 
 def override_get_session_dep(
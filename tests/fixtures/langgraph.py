@@ -32,15 +32,36 @@ def make_snapshot(
     return FakeSnapshot(values, cfg, created_at, next_nodes)
 
 
+class _AsyncListIter:
+    """Async iterator over a prebuilt sequence.
+
+    Cheaper than spinning up an async generator frame per call when the
+    items are already materialized in a list.
+    """
+
+    __slots__ = ("_it",)
+
+    def __init__(self, seq):
+        self._it = iter(seq)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
 class FakeAgent:
     """Mock LangGraph agent"""
 
     def __init__(self, snapshots: list[FakeSnapshot]):
         self._snapshots = snapshots
 
-    async def aget_state_history(self, config, **_kwargs):
-        for s in self._snapshots:
-            yield s
+    def aget_state_history(self, config, **_kwargs):
+        return _AsyncListIter(self._snapshots)
 
 
 class FakeGraph:
@@ -49,9 +70,8 @@ class FakeGraph:
     def __init__(self, events: list[Any]):
         self._events = events
 
-    async def astream(self, _input, config=None, stream_mode=None):
-        for e in self._events:
-            yield e
+    def astream(self, _input, config=None, stream_mode=None):
+        return _AsyncListIter(self._events)
 
 
 class MockLangGraphService:
@@ -67,12 +67,24 @@ def create_session_fixture(session_class: type = BasicSession, **kwargs):
     return _session
 
 
-def override_session_dependency(app, session_class: type = BasicSession, **kwargs):
-    """Override the session dependency with a mock session"""
+def override_session_dependency(app, session_class=BasicSession, **kwargs):
+    """Override the session dependency with a mock session
+
+    Accepts a session class (instantiated with kwargs per request) or a
+    ready instance, e.g. from make_session().
+    """
     from agent_server.core.orm import get_session as core_get_session
 
-    def session_factory():
-        return session_class(**kwargs)
+    if isinstance(session_class, type):
+
+        def session_factory():
+            return session_class(**kwargs)
+
+    else:
+        session = session_class
+
+        def session_factory():
+            return session
 
     app.dependency_overrides[core_get_session] = override_get_session_dep(
         session_factory
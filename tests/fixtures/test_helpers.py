@@ -5,6 +5,10 @@ from typing import Any
 
 from agent_server.models import Assistant, Run, Thread
 
+# Fixed timestamp shared by all factories: no test asserts on these values,
+# so there is no reason to hit the clock twice per mock object
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 def make_assistant(
     assistant_id: str = "test-assistant-123",
@@ -22,8 +26,8 @@ def make_assistant(
         graph_id=graph_id,
         metadata_dict=metadata or {},
         user_id=user_id,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
         config={},
         version=1,
     )
@@ -41,8 +45,8 @@ def make_thread(
         status=status,
         metadata=metadata or {"owner": user_id},
         user_id=user_id,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
 
 
@@ -66,8 +70,8 @@ def make_run(
         metadata=metadata or {},
         input=input_data or {"message": "test"},
         output=output_data,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
 
 
@@ -93,8 +97,8 @@ class DummyRun:
         self.metadata = metadata or {}
         self.input = input_data or {"message": "test"}
         self.output = output_data
-        self.created_at = datetime.now(UTC)
-        self.updated_at = datetime.now(UTC)
+        self.created_at = _FIXED_NOW
+        self.updated_at = _FIXED_NOW
 
 
 class DummyThread:
@@ -111,8 +115,8 @@ class DummyThread:
         self.status = status
         self.metadata = metadata or {"owner": user_id}
         self.user_id = user_id
-        self.created_at = datetime.now(UTC)
-        self.updated_at = datetime.now(UTC)
+        self.created_at = _FIXED_NOW
+        self.updated_at = _FIXED_NOW
 
 
 class DummyStoreItem:
@@ -108,7 +108,7 @@ class TestListAssistants:
             make_assistant("asst-2", "Assistant 2", "graph-2"),
             make_assistant("asst-3", "Assistant 3", "graph-1"),
         ]
-        mock_assistant_service.list_assistants.return_value = assistants
+        mock_assistant_service.list_assistants.return_value = (assistants, 3)
 
         resp = client.get("/assistants")
 
@@ -122,7 +122,7 @@ class TestListAssistants:
 
     def test_list_assistants_empty(self, client, mock_assistant_service):
         """Test listing assistants when user has none"""
-        mock_assistant_service.list_assistants.return_value = []
+        mock_assistant_service.list_assistants.return_value = ([], 0)
 
         resp = client.get("/assistants")
 
@@ -131,6 +131,45 @@ class TestListAssistants:
         assert data["total"] == 0
         assert data["assistants"] == []
 
+    def test_list_assistants_skip_total(self, client, mock_assistant_service):
+        """Test listing with skip_total omits the count"""
+        assistants = [make_assistant("asst-1", "Assistant 1")]
+        mock_assistant_service.list_assistants.return_value = (assistants, None)
+
+        resp = client.get("/assistants?skip_total=true")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] is None
+        assert len(data["assistants"]) == 1
+        mock_assistant_service.list_assistants.assert_called_once_with(
+            "test-user", 50, 0, True
+        )
+
+
+class TestStreamAssistants:
+    """Test GET /assistants/stream"""
+
+    def test_stream_assistants(self, client, mock_assistant_service):
+        """Test streaming assistants as a JSON payload"""
+        from unittest.mock import Mock
+
+        assistant = make_assistant()
+
+        async def _gen():
+            yield b'{"assistants":['
+            yield assistant.model_dump_json().encode()
+            yield b"]}"
+
+        mock_assistant_service.stream_assistants = Mock(return_value=_gen())
+
+        resp = client.get("/assistants/stream")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["assistants"]) == 1
+        assert data["assistants"][0]["assistant_id"] == "test-assistant-123"
+
 
 class TestGetAssistant:
     """Test GET /assistants/{assistant_id}"""
@@ -487,6 +526,82 @@ class TestSearchAssistants:
         assert data[0]["graph_id"] == "prod-graph"
 
 
+class TestSearchAssistantsCursor:
+    """Test POST /assistants/search/cursor"""
+
+    def test_cursor_search_returns_page_and_cursor(
+        self, client, mock_assistant_service
+    ):
+        """Test keyset search returns the page plus an opaque next cursor"""
+        assistants = [
+            make_assistant("asst-1", "Assistant 1"),
+            make_assistant("asst-2", "Assistant 2"),
+        ]
+        mock_assistant_service.search_assistants_cursor.return_value = (
+            assistants,
+            "b64cursor",
+        )
+
+        resp = client.post("/assistants/search/cursor", json={"limit": 2})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["assistants"]) == 2
+        assert data["next_cursor"] == "b64cursor"
+
+    def test_cursor_search_last_page(self, client, mock_assistant_service):
+        """Test keyset search signals the last page with a null cursor"""
+        mock_assistant_service.search_assistants_cursor.return_value = ([], None)
+
+        resp = client.post(
+            "/assistants/search/cursor",
+            json={"cursor_after": "b64cursor"},
+        )
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["assistants"] == []
+        assert data["next_cursor"] is None
+
+
+class TestSearchAssistantsWithTotal:
+    """Test POST /assistants/search/total"""
+
+    def test_search_with_total_returns_page_and_count(
+        self, client, mock_assistant_service
+    ):
+        """Test combined search returns the page plus the total match count"""
+        assistants = [
+            make_assistant("asst-1", "Assistant 1"),
+            make_assistant("asst-2", "Assistant 2"),
+        ]
+        mock_assistant_service.search_assistants_with_total.return_value = (
+            assistants,
+            7,
+        )
+
+        resp = client.post("/assistants/search/total", json={"limit": 2})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["assistants"]) == 2
+        assert data["total"] == 7
+
+    def test_search_with_total_zero_results(self, client, mock_assistant_service):
+        """Test combined search when nothing matches"""
+        mock_assistant_service.search_assistants_with_total.return_value = ([], 0)
+
+        resp = client.post(
+            "/assistants/search/total",
+            json={"graph_id": "nonexistent-graph"},
+        )
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["assistants"] == []
+        assert data["total"] == 0
+
+
 class TestCountAssistants:
     """Test POST /assistants/count"""
 
@@ -1,13 +1,43 @@
 """Integration tests for runs CRUD operations"""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-from tests.fixtures.clients import create_test_app, make_client
-from tests.fixtures.database import DummySessionBase
+import pytest
+
+from tests.fixtures.clients import create_test_app, make_async_client
+from tests.fixtures.database import make_session
 from tests.fixtures.session_fixtures import BasicSession, override_session_dependency
 from tests.fixtures.test_helpers import DummyRun, DummyThread
 
 
+def _table(*column_names: str) -> SimpleNamespace:
+    """Build a fake __table__ with the given column names."""
+    return SimpleNamespace(columns=[SimpleNamespace(name=n) for n in column_names])
+
+
+# Shared across all rows: the helpers below used to rebuild these column
+# lists (and their classes) on every call
+_THREAD_TABLE = _table(
+    "thread_id", "status", "metadata", "user_id", "created_at", "updated_at"
+)
+_RUN_TABLE = _table(
+    "run_id",
+    "thread_id",
+    "assistant_id",
+    "status",
+    "user_id",
+    "metadata",
+    "input",
+    "output",
+    "error_message",
+    "config",
+    "context",
+    "created_at",
+    "updated_at",
+)
+
+
 def _thread_row(
     thread_id="test-thread-123", status="idle", metadata=None, user_id="test-user"
 ):
@@ -16,22 +46,7 @@ def _thread_row(
 
     # Add ORM-specific attributes
     thread.metadata_json = metadata or {}
-
-    class _Col:
-        def __init__(self, name):
-            self.name = name
-
-    class _T:
-        columns = [
-            _Col("thread_id"),
-            _Col("status"),
-            _Col("metadata"),
-            _Col("user_id"),
-            _Col("created_at"),
-            _Col("updated_at"),
-        ]
-
-    thread.__table__ = _T()
+    thread.__table__ = _THREAD_TABLE
     return thread
 
 
@@ -78,97 +93,76 @@ def _run_row(
     run.error_message = None
     run.config = {}
     run.context = {}
+    run.__table__ = _RUN_TABLE
+    return run
 
-    class _Col:
-        def __init__(self, name):
-            self.name = name
-
-    class _T:
-        columns = [
-            _Col("run_id"),
-            _Col("thread_id"),
-            _Col("assistant_id"),
-            _Col("status"),
-            _Col("user_id"),
-            _Col("metadata"),
-            _Col("input"),
-            _Col("output"),
-            _Col("error_message"),
-            _Col("config"),
-            _Col("context"),
-            _Col("created_at"),
-            _Col("updated_at"),
-        ]
 
-    run.__table__ = _T()
-    return run
+# Pure fixtures, never mutated: built once at import instead of per test
+_RUNS_10 = tuple(_run_row(f"run-{i}") for i in range(10))
+_RUNS_5 = _RUNS_10[:5]
 
 
 class TestCreateRun:
     """Test POST /threads/{thread_id}/runs"""
 
-    def test_create_run_validation_error_no_input_or_command(self):
+    @pytest.mark.asyncio
+    async def test_create_run_validation_error_no_input_or_command(self):
         """Test that run creation requires either input or command"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         # Use BasicSession from shared fixtures
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
+        async with make_async_client(app) as client:
 
-        resp = client.post(
-            "/threads/test-thread-123/runs",
-            json={"assistant_id": "asst-123"},
-        )
+            resp = await client.post(
+                "/threads/test-thread-123/runs",
+                json={"assistant_id": "asst-123"},
+            )
 
-        # Should get validation error (422) for missing input/command
-        assert resp.status_code == 422
+            # Should get validation error (422) for missing input/command
+            assert resp.status_code == 422
 
 
 class TestGetRun:
     """Test GET /threads/{thread_id}/runs/{run_id}"""
 
-    def test_get_run_success(self):
+    @pytest.mark.asyncio
+    async def test_get_run_success(self):
         """Test getting an existing run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         run = _run_row(status="completed")
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return run
+        override_session_dependency(app, make_session(scalar=run))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            resp = await client.get("/threads/test-thread-123/runs/test-run-123")
 
-        resp = client.get("/threads/test-thread-123/runs/test-run-123")
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["run_id"] == "test-run-123"
-        assert data["thread_id"] == "test-thread-123"
-        assert data["status"] == "completed"
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["run_id"] == "test-run-123"
+            assert data["thread_id"] == "test-thread-123"
+            assert data["status"] == "completed"
 
-    def test_get_run_not_found(self):
+    @pytest.mark.asyncio
+    async def test_get_run_not_found(self):
         """Test getting a non-existent run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return None
+        override_session_dependency(app, make_session(scalar=None))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            resp = await client.get("/threads/test-thread-123/runs/nonexistent")
 
-        resp = client.get("/threads/test-thread-123/runs/nonexistent")
-
-        assert resp.status_code == 404
+            assert resp.status_code == 404
 
 
 class TestListRuns:
     """Test GET /threads/{thread_id}/runs"""
 
-    def test_list_runs_success(self):
+    @pytest.mark.asyncio
+    async def test_list_runs_success(self):
         """Test listing runs for a thread"""
         app = create_test_app(include_runs=True, include_threads=False)
 
@@ -178,305 +172,241 @@ class TestListRuns:
             _run_row("run-3", status="pending"),
         ]
 
-        class Session(DummySessionBase):
-            async def scalars(self, _stmt):
-                class Result:
-                    def all(self):
-                        return runs
-
-                return Result()
+        override_session_dependency(app, make_session(scalars=runs))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            resp = await client.get("/threads/test-thread-123/runs")
 
-        resp = client.get("/threads/test-thread-123/runs")
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert isinstance(data, list)
-        assert len(data) == 3
-        assert data[0]["run_id"] == "run-1"
+            assert resp.status_code == 200
+            data = resp.json()
+            assert isinstance(data, list)
+            assert len(data) == 3
+            assert data[0]["run_id"] == "run-1"
 
-    def test_list_runs_empty(self):
+    @pytest.mark.asyncio
+    async def test_list_runs_empty(self):
         """Test listing runs when thread has none"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalars(self, _stmt):
-                class Result:
-                    def all(self):
-                        return []
+        override_session_dependency(app, make_session(scalars=[]))
+        async with make_async_client(app) as client:
 
-                return Result()
-
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
+            resp = await client.get("/threads/test-thread-123/runs")
 
-        resp = client.get("/threads/test-thread-123/runs")
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data == []
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data == []
 
-    def test_list_runs_with_limit(self):
+    @pytest.mark.asyncio
+    async def test_list_runs_with_limit(self):
         """Test listing runs with limit parameter"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        runs = [_run_row(f"run-{i}") for i in range(5)]
-
-        class Session(DummySessionBase):
-            async def scalars(self, _stmt):
-                class Result:
-                    def all(self):
-                        return runs[:2]  # Simulate limit
-
-                return Result()
+        # Simulate limit
+        override_session_dependency(app, make_session(scalars=list(_RUNS_5[:2])))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.get("/threads/test-thread-123/runs?limit=2")
+            resp = await client.get("/threads/test-thread-123/runs?limit=2")
 
-        assert resp.status_code == 200
-        data = resp.json()
-        assert len(data) <= 5
+            assert resp.status_code == 200
+            data = resp.json()
+            assert len(data) <= 5
 
-    def test_list_runs_with_offset(self):
+    @pytest.mark.asyncio
+    async def test_list_runs_with_offset(self):
         """Test listing runs with offset parameter"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        runs = [_run_row(f"run-{i}") for i in range(10)]
-
-        class Session(DummySessionBase):
-            async def scalars(self, _stmt):
-                class Result:
-                    def all(self):
-                        return runs[5:]  # Simulate offset
+        # Simulate offset
+        override_session_dependency(app, make_session(scalars=list(_RUNS_10[5:])))
+        async with make_async_client(app) as client:
 
-                return Result()
+            resp = await client.get("/threads/test-thread-123/runs?offset=5")
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.get("/threads/test-thread-123/runs?offset=5")
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert isinstance(data, list)
+            assert resp.status_code == 200
+            data = resp.json()
+            assert isinstance(data, list)
 
 
 class TestUpdateRun:
     """Test PATCH /threads/{thread_id}/runs/{run_id}"""
 
-    def test_update_run_validation(self):
+    @pytest.mark.asyncio
+    async def test_update_run_validation(self):
         """Test updating run requires valid payload"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         # Use BasicSession from shared fixtures
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
+        async with make_async_client(app) as client:
 
-        # Empty update should fail validation
-        resp = client.patch(
-            "/threads/test-thread-123/runs/test-run-123",
-            json={},
-        )
+            # Empty update should fail validation
+            resp = await client.patch(
+                "/threads/test-thread-123/runs/test-run-123",
+                json={},
+            )
 
-        assert resp.status_code == 422
+            assert resp.status_code == 422
 
 
 class TestCancelRun:
     """Test POST /threads/{thread_id}/runs/{run_id}/cancel"""
 
-    def test_cancel_run_not_found(self):
+    @pytest.mark.asyncio
+    async def test_cancel_run_not_found(self):
         """Test canceling a non-existent run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return None
+        override_session_dependency(app, make_session(scalar=None))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.post("/threads/test-thread-123/runs/nonexistent/cancel")
+            resp = await client.post("/threads/test-thread-123/runs/nonexistent/cancel")
 
-        assert resp.status_code == 404
+            assert resp.status_code == 404
 
-    def test_cancel_run_success(self):
+    @pytest.mark.asyncio
+    async def test_cancel_run_success(self):
         """Test successfully canceling a run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         run = _run_row(status="running")
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return run
-
-            async def execute(self, _stmt):
-                pass
-
-            async def commit(self):
-                pass
+        override_session_dependency(app, make_session(scalar=run, execute=True))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            with patch("agent_server.api.runs.streaming_service") as mock_streaming:
+                mock_streaming.cancel_run = AsyncMock()
 
-        with patch("agent_server.api.runs.streaming_service") as mock_streaming:
-            mock_streaming.cancel_run = AsyncMock()
+                resp = await client.post("/threads/test-thread-123/runs/test-run-123/cancel")
 
-            resp = client.post("/threads/test-thread-123/runs/test-run-123/cancel")
-
-            assert resp.status_code == 200
+                assert resp.status_code == 200
 
 
 class TestDeleteRun:
     """Test DELETE /threads/{thread_id}/runs/{run_id}"""
 
-    def test_delete_run_not_found(self):
+    @pytest.mark.asyncio
+    async def test_delete_run_not_found(self):
         """Test deleting a non-existent run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return None
+        override_session_dependency(app, make_session(scalar=None))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
+            resp = await client.delete("/threads/test-thread-123/runs/nonexistent")
 
-        resp = client.delete("/threads/test-thread-123/runs/nonexistent")
+            assert resp.status_code == 404
 
-        assert resp.status_code == 404
-
-    def test_delete_run_active_not_allowed(self):
+    @pytest.mark.asyncio
+    async def test_delete_run_active_not_allowed(self):
         """Test deleting an active run is not allowed"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         run = _run_row(status="running")
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return run
+        override_session_dependency(app, make_session(scalar=run))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
+            resp = await client.delete("/threads/test-thread-123/runs/test-run-123")
 
-        resp = client.delete("/threads/test-thread-123/runs/test-run-123")
+            # Should return error (400, 409, etc.) for active run
+            assert resp.status_code >= 400
+            assert resp.status_code < 500
 
-        # Should return error (400, 409, etc.) for active run
-        assert resp.status_code >= 400
-        assert resp.status_code < 500
-
-    def test_delete_run_success(self):
+    @pytest.mark.asyncio
+    async def test_delete_run_success(self):
         """Test successfully deleting a completed run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         run = _run_row(status="completed")
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return run
-
-            async def execute(self, _stmt):
-                pass
-
-            async def commit(self):
-                pass
-
-        override_session_dependency(app, Session)
-        client = make_client(app)
+        override_session_dependency(app, make_session(scalar=run, execute=True))
+        async with make_async_client(app) as client:
 
-        resp = client.delete("/threads/test-thread-123/runs/test-run-123")
+            resp = await client.delete("/threads/test-thread-123/runs/test-run-123")
 
-        assert resp.status_code == 204
+            assert resp.status_code == 204
 
 
 class TestJoinRun:
     """Test GET /threads/{thread_id}/runs/{run_id}/join"""
 
-    def test_join_run_not_found(self):
+    @pytest.mark.asyncio
+    async def test_join_run_not_found(self):
         """Test joining a non-existent run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return None
+        override_session_dependency(app, make_session(scalar=None))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.get("/threads/test-thread-123/runs/nonexistent/join")
+            resp = await client.get("/threads/test-thread-123/runs/nonexistent/join")
 
-        assert resp.status_code == 404
+            assert resp.status_code == 404
 
-    def test_join_run_already_completed(self):
+    @pytest.mark.asyncio
+    async def test_join_run_already_completed(self):
         """Test joining an already completed run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         run = _run_row(status="completed")
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return run
+        override_session_dependency(app, make_session(scalar=run))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            resp = await client.get("/threads/test-thread-123/runs/test-run-123/join")
 
-        resp = client.get("/threads/test-thread-123/runs/test-run-123/join")
-
-        assert resp.status_code == 200
-        # Response may vary depending on run state
-        assert isinstance(resp.json(), (dict, list))
+            assert resp.status_code == 200
+            # Response may vary depending on run state
+            assert isinstance(resp.json(), (dict, list))
 
 
 class TestStreamRun:
     """Test GET /threads/{thread_id}/runs/{run_id}/stream"""
 
-    def test_stream_run_not_found(self):
+    @pytest.mark.asyncio
+    async def test_stream_run_not_found(self):
         """Test streaming a non-existent run"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return None
+        override_session_dependency(app, make_session(scalar=None))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.get("/threads/test-thread-123/runs/nonexistent/stream")
+            resp = await client.get("/threads/test-thread-123/runs/nonexistent/stream")
 
-        assert resp.status_code == 404
+            assert resp.status_code == 404
 
 
 class TestRunWithInput:
     """Test creating runs with input vs command"""
 
-    def test_create_run_with_input_validation(self):
+    @pytest.mark.asyncio
+    async def test_create_run_with_input_validation(self):
         """Test creating run with input passes validation"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         # Use BasicSession from shared fixtures
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
+        async with make_async_client(app) as client:
 
-        resp = client.post(
-            "/threads/test-thread-123/runs",
-            json={
-                "assistant_id": "test-assistant-123",
-                "input": {"message": "Hello"},
-            },
-        )
+            resp = await client.post(
+                "/threads/test-thread-123/runs",
+                json={
+                    "assistant_id": "test-assistant-123",
+                    "input": {"message": "Hello"},
+                },
+            )
 
-        # Should not be a validation error
-        assert resp.status_code != 422
+            # Should not be a validation error
+            assert resp.status_code != 422
 
 
 class TestRunStatuses:
     """Test filtering runs by status"""
 
-    def test_list_runs_filter_by_status(self):
+    @pytest.mark.asyncio
+    async def test_list_runs_filter_by_status(self):
         """Test filtering runs by status"""
         app = create_test_app(include_runs=True, include_threads=False)
 
@@ -485,210 +415,194 @@ class TestRunStatuses:
             _run_row("run-2", status="completed"),
         ]
 
-        class Session(DummySessionBase):
-            async def scalars(self, _stmt):
-                class Result:
-                    def all(self):
-                        return runs
+        override_session_dependency(app, make_session(scalars=runs))
+        async with make_async_client(app) as client:
 
-                return Result()
-
-        override_session_dependency(app, BasicSession)
-        client = make_client(app)
+            resp = await client.get("/threads/test-thread-123/runs?status=completed")
 
-        resp = client.get("/threads/test-thread-123/runs?status=completed")
-
-        assert resp.status_code == 200
-        data = resp.json()
-        assert isinstance(data, list)
+            assert resp.status_code == 200
+            data = resp.json()
+            assert isinstance(data, list)
 
 
 class TestWaitForRun:
     """Test POST /threads/{thread_id}/runs/wait"""
 
-    def test_wait_for_run_validation_no_input(self):
+    @pytest.mark.asyncio
+    async def test_wait_for_run_validation_no_input(self):
         """Test that wait endpoint requires input or command"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
+        async with make_async_client(app) as client:
 
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={"assistant_id": "asst-123"},
-        )
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={"assistant_id": "asst-123"},
+            )
 
-        # Should get validation error (422) for missing input/command
-        assert resp.status_code == 422
+            # Should get validation error (422) for missing input/command
+            assert resp.status_code == 422
 
-    def test_wait_for_run_thread_not_found(self):
+    @pytest.mark.asyncio
+    async def test_wait_for_run_thread_not_found(self):
         """Test wait endpoint with non-existent thread"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                # Return None for thread lookup
-                return None
+        # scalar returns None for the thread lookup
+        override_session_dependency(app, make_session(scalar=None))
+        async with make_async_client(app) as client:
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            resp = await client.post(
+                "/threads/nonexistent/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "input": {"message": "test"},
+                },
+            )
 
-        resp = client.post(
-            "/threads/nonexistent/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "input": {"message": "test"},
-            },
-        )
+            # Should get 404 when thread doesn't exist
+            assert resp.status_code == 404
 
-        # Should get 404 when thread doesn't exist
-        assert resp.status_code == 404
-
-    def test_wait_for_run_assistant_not_found(self):
+    @pytest.mark.asyncio
+    async def test_wait_for_run_assistant_not_found(self):
         """Test wait endpoint with non-existent assistant"""
         app = create_test_app(include_runs=True, include_threads=False)
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                # Return None for assistant lookup (thread validation is skipped in wait endpoint)
-                return None
-
-            async def execute(self, _stmt):
-                pass
+        # scalar returns None for the assistant lookup (thread validation is
+        # skipped in the wait endpoint)
+        override_session_dependency(app, make_session(scalar=None, execute=True))
+        async with make_async_client(app) as client:
 
-            async def commit(self):
-                pass
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "nonexistent-asst",
+                    "input": {"message": "test"},
+                },
+            )
 
-        override_session_dependency(app, Session)
-        client = make_client(app)
+            # Should get 404 when assistant doesn't exist
+            assert resp.status_code == 404
 
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "nonexistent-asst",
-                "input": {"message": "test"},
-            },
-        )
-
-        # Should get 404 when assistant doesn't exist
-        assert resp.status_code == 404
-
-    def test_wait_for_run_with_interrupt_before(self):
+    @pytest.mark.asyncio
+    async def test_wait_for_run_with_interrupt_before(self):
         """Test wait endpoint accepts interrupt_before parameter"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "input": {"message": "test"},
-                "interrupt_before": ["node1", "node2"],
-            },
-        )
-
-        # Should accept the parameter (may fail later in execution, but not validation)
-        assert resp.status_code != 422
-
-    def test_wait_for_run_with_stream_subgraphs(self):
+        async with make_async_client(app) as client:
+
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "input": {"message": "test"},
+                    "interrupt_before": ["node1", "node2"],
+                },
+            )
+
+            # Should accept the parameter (may fail later in execution, but not validation)
+            assert resp.status_code != 422
+
+    @pytest.mark.asyncio
+    async def test_wait_for_run_with_stream_subgraphs(self):
         """Test wait endpoint accepts stream_subgraphs parameter"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "input": {"message": "test"},
-                "stream_subgraphs": True,
-            },
-        )
-
-        # Should accept the parameter
-        assert resp.status_code != 422
-
-    def test_wait_for_run_with_command(self):
+        async with make_async_client(app) as client:
+
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "input": {"message": "test"},
+                    "stream_subgraphs": True,
+                },
+            )
+
+            # Should accept the parameter
+            assert resp.status_code != 422
+
+    @pytest.mark.asyncio
+    async def test_wait_for_run_with_command(self):
         """Test wait endpoint with command instead of input"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
+        async with make_async_client(app) as client:
 
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "command": {"resume": "value"},
-            },
-        )
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "command": {"resume": "value"},
+                },
+            )
 
-        # Should accept command parameter
-        assert resp.status_code != 422
+            # Should accept command parameter
+            assert resp.status_code != 422
 
-    def test_wait_for_run_cannot_have_both_input_and_command(self):
+    @pytest.mark.asyncio
+    async def test_wait_for_run_cannot_have_both_input_and_command(self):
         """Test wait endpoint rejects both input and command"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "input": {"message": "test"},
-                "command": {"resume": "value"},
-            },
-        )
-
-        # Should reject having both
-        assert resp.status_code == 422
-
-    def test_wait_for_run_resume_requires_interrupted_thread(self):
+        async with make_async_client(app) as client:
+
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "input": {"message": "test"},
+                    "command": {"resume": "value"},
+                },
+            )
+
+            # Should reject having both
+            assert resp.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_wait_for_run_resume_requires_interrupted_thread(self):
         """Test wait endpoint with resume command requires interrupted thread"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         # Thread is idle, not interrupted
         thread = _thread_row(status="idle")
 
-        class Session(DummySessionBase):
-            async def scalar(self, _stmt):
-                return thread
-
-        override_session_dependency(app, Session)
-        client = make_client(app)
+        override_session_dependency(app, make_session(scalar=thread))
+        async with make_async_client(app) as client:
 
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "command": {"resume": "value"},
-            },
-        )
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "command": {"resume": "value"},
+                },
+            )
 
-        # Should fail because thread is not interrupted
-        assert resp.status_code == 400
+            # Should fail because thread is not interrupted
+            assert resp.status_code == 400
 
-    def test_wait_for_run_with_config_and_context_conflict(self):
+    @pytest.mark.asyncio
+    async def test_wait_for_run_with_config_and_context_conflict(self):
         """Test wait endpoint rejects both configurable and context"""
         app = create_test_app(include_runs=True, include_threads=False)
 
         override_session_dependency(app, BasicSession)
-        client = make_client(app)
-
-        resp = client.post(
-            "/threads/test-thread-123/runs/wait",
-            json={
-                "assistant_id": "asst-123",
-                "input": {"message": "test"},
-                "config": {"configurable": {"key": "value"}},
-                "context": {"key": "value"},
-            },
-        )
-
-        # Should reject having both configurable and context
-        assert resp.status_code == 400
+        async with make_async_client(app) as client:
+
+            resp = await client.post(
+                "/threads/test-thread-123/runs/wait",
+                json={
+                    "assistant_id": "asst-123",
+                    "input": {"message": "test"},
+                    "config": {"configurable": {"key": "value"}},
+                    "context": {"key": "value"},
+                },
+            )
+
+            # Should reject having both configurable and context
+            assert resp.status_code == 400
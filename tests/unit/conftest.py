@@ -5,19 +5,24 @@ Unit tests should be fast and isolated, with no external dependencies.
 
 import pytest
 
+from src.agent_server.observability.base import get_observability_manager
+
+# Resolved once at import; the manager is a process-wide singleton, so
+# re-fetching it per test only added fixture overhead.
+_observability_manager = get_observability_manager()
+
 
 @pytest.fixture(autouse=True)
 def reset_observability_manager():
-    """Reset the global observability manager before each test.
+    """Snapshot and restore the global observability manager around each test.
 
     This ensures tests don't interfere with each other when they reload
     modules that create and register observability providers.
     """
-    from src.agent_server.observability.base import get_observability_manager
-
-    manager = get_observability_manager()
-    # Clear all registered providers before each test
-    manager._providers.clear()
-    yield
-    # Clean up after test
-    manager._providers.clear()
+    providers = _observability_manager._providers
+    saved = providers.copy()
+    providers.clear()
+    try:
+        yield
+    finally:
+        providers[:] = saved
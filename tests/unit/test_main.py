@@ -1,136 +1,140 @@
 """Tests for application lifespan and startup logic"""
 
-import importlib
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+import src.agent_server.main as main_module
+from src.agent_server.main import lifespan
 from src.agent_server.observability.base import get_observability_manager
+from src.agent_server.observability.langfuse_integration import LangfuseProvider
+
+
+class _AsyncCallCounter:
+    """Minimal awaitable stand-in for AsyncMock.
+
+    The lifespan tests only await these methods and assert the call
+    count, so a slotted counter avoids AsyncMock's construction cost.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.calls += 1
+
+    def assert_called_once(self):
+        assert self.calls == 1, f"expected exactly one call, got {self.calls}"
+
+
+@pytest.fixture
+def lifespan_mocks():
+    """Fake dependency set shared by the lifespan tests.
+
+    Plain namespaces carrying only the awaited methods are much cheaper to
+    build than auto-generated MagicMocks. (A module-scoped prototype
+    restored via copy.copy would share child mocks - and their call
+    counts - across tests, so each test gets a fresh set.)
+    """
+    langgraph_service = SimpleNamespace(initialize=_AsyncCallCounter())
+    return SimpleNamespace(
+        db_manager=SimpleNamespace(
+            initialize=_AsyncCallCounter(), close=_AsyncCallCounter()
+        ),
+        langgraph_service=langgraph_service,
+        get_langgraph_service=lambda: langgraph_service,
+        event_store=SimpleNamespace(
+            start_cleanup_task=_AsyncCallCounter(), stop_cleanup_task=_AsyncCallCounter()
+        ),
+    )
+
+
+def _install_lifespan_mocks(monkeypatch, mocks):
+    """Swap the fakes into the main module; monkeypatch restores the real
+    attributes at teardown without mock.patch's per-enter/exit machinery."""
+    monkeypatch.setattr(main_module, "db_manager", mocks.db_manager)
+    monkeypatch.setattr(
+        main_module, "get_langgraph_service", mocks.get_langgraph_service
+    )
+    monkeypatch.setattr(main_module, "event_store", mocks.event_store)
 
 
 @pytest.mark.unit
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_lifespan_registers_langfuse_provider(monkeypatch):
+async def test_lifespan_registers_langfuse_provider(monkeypatch, lifespan_mocks):
     """Test that the lifespan function registers the Langfuse provider during startup."""
-    # Enable Langfuse so the provider will be registered
+    # Enable Langfuse so the provider will be registered; is_enabled() reads
+    # the env at call time, so no module reload is needed
     monkeypatch.setenv("LANGFUSE_LOGGING", "true")
 
-    # Reload the module to pick up the env var change
-    import src.agent_server.observability.langfuse_integration as langfuse_module
+    _install_lifespan_mocks(monkeypatch, lifespan_mocks)
+
+    # Start the observability manager from an empty provider list; an O(1)
+    # rebind avoids clear()'s element-by-element decref walk, and monkeypatch
+    # restores the original list object at teardown
+    manager = get_observability_manager()
+    monkeypatch.setattr(manager, "_providers", [])
+
+    # Create a mock FastAPI app
+    mock_app = MagicMock()
+
+    # Run the lifespan function
+    async with lifespan(mock_app):
+        # Verify that a LangfuseProvider instance is registered
+        langfuse_providers = [
+            p for p in manager._providers if isinstance(p, LangfuseProvider)
+        ]
+        assert len(langfuse_providers) == 1, (
+            "Langfuse provider should be registered during lifespan startup"
+        )
 
-    importlib.reload(langfuse_module)
-    # Reload main module to get the updated provider
-    import src.agent_server.main as main_module
-    from src.agent_server.observability.langfuse_integration import (
-        LangfuseProvider,
-    )
+        # Verify the observability manager can get callbacks from registered provider
+        callbacks = manager.get_all_callbacks()
+        # If Langfuse is enabled, we'd get callbacks; if disabled, empty list
+        # Either way, the provider should be registered
+        assert isinstance(callbacks, list)
 
-    importlib.reload(main_module)
-    from src.agent_server.main import lifespan
-
-    # Mock all the dependencies that lifespan needs
-    with (
-        patch("src.agent_server.main.db_manager") as mock_db_manager,
-        patch(
-            "src.agent_server.main.get_langgraph_service"
-        ) as mock_get_langgraph_service,
-        patch("src.agent_server.main.event_store") as mock_event_store,
-    ):
-        # Setup mocks
-        mock_db_manager.initialize = AsyncMock()
-        mock_db_manager.close = AsyncMock()
-
-        mock_langgraph_service = MagicMock()
-        mock_langgraph_service.initialize = AsyncMock()
-        mock_get_langgraph_service.return_value = mock_langgraph_service
-
-        mock_event_store.start_cleanup_task = AsyncMock()
-        mock_event_store.stop_cleanup_task = AsyncMock()
-
-        # Clear the observability manager before test
-        manager = get_observability_manager()
-        manager._providers.clear()
-
-        # Create a mock FastAPI app
-        mock_app = MagicMock()
-
-        # Run the lifespan function
-        async with lifespan(mock_app):
-            # Verify that a LangfuseProvider instance is registered
-            # Check by type since reloading creates a new instance
-            langfuse_providers = [
-                p for p in manager._providers if isinstance(p, LangfuseProvider)
-            ]
-            assert len(langfuse_providers) == 1, (
-                "Langfuse provider should be registered during lifespan startup"
-            )
-
-            # Verify the observability manager can get callbacks from registered provider
-            callbacks = manager.get_all_callbacks()
-            # If Langfuse is enabled, we'd get callbacks; if disabled, empty list
-            # Either way, the provider should be registered
-            assert isinstance(callbacks, list)
-
-        # Verify cleanup was called
-        mock_db_manager.close.assert_called_once()
+    # Verify cleanup was called
+    lifespan_mocks.db_manager.close.assert_called_once()
 
 
 @pytest.mark.unit
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_lifespan_calls_required_initialization():
+async def test_lifespan_calls_required_initialization(monkeypatch, lifespan_mocks):
     """Test that lifespan calls all required initialization functions."""
-    from src.agent_server.main import lifespan
-
-    with (
-        patch("src.agent_server.main.db_manager") as mock_db_manager,
-        patch(
-            "src.agent_server.main.get_langgraph_service"
-        ) as mock_get_langgraph_service,
-        patch("src.agent_server.main.event_store") as mock_event_store,
-        patch(
-            "src.agent_server.main.get_observability_manager"
-        ) as mock_get_observability_manager,
-    ):
-        # Setup mocks
-        mock_db_manager.initialize = AsyncMock()
-        mock_db_manager.close = AsyncMock()
-
-        mock_langgraph_service = MagicMock()
-        mock_langgraph_service.initialize = AsyncMock()
-        mock_get_langgraph_service.return_value = mock_langgraph_service
-
-        mock_event_store.start_cleanup_task = AsyncMock()
-        mock_event_store.stop_cleanup_task = AsyncMock()
-
-        mock_manager = MagicMock()
-        mock_get_observability_manager.return_value = mock_manager
-
-        mock_app = MagicMock()
-
-        # Run the lifespan function
-        async with lifespan(mock_app):
-            pass
-
-        # Verify all initialization functions were called
-        mock_db_manager.initialize.assert_called_once()
-        mock_langgraph_service.initialize.assert_called_once()
-        mock_event_store.start_cleanup_task.assert_called_once()
-
-        # Verify observability manager was used to register provider
-        mock_get_observability_manager.assert_called()
-        # Check that register_provider was called with a LangfuseProvider instance
-        assert mock_manager.register_provider.called, (
-            "register_provider should be called"
-        )
-        call_args = mock_manager.register_provider.call_args
-        assert call_args is not None
-        # Verify it was called with a LangfuseProvider (check by type/class name)
-        from src.agent_server.observability.langfuse_integration import LangfuseProvider
+    mock_manager = MagicMock()
 
-        assert isinstance(call_args[0][0], LangfuseProvider), (
-            "register_provider should be called with LangfuseProvider instance"
-        )
+    _install_lifespan_mocks(monkeypatch, lifespan_mocks)
+    monkeypatch.setattr(
+        main_module, "get_observability_manager", MagicMock(return_value=mock_manager)
+    )
+
+    mock_app = MagicMock()
+
+    # Run the lifespan function
+    async with lifespan(mock_app):
+        pass
+
+    # Verify all initialization functions were called
+    lifespan_mocks.db_manager.initialize.assert_called_once()
+    lifespan_mocks.langgraph_service.initialize.assert_called_once()
+    lifespan_mocks.event_store.start_cleanup_task.assert_called_once()
+
+    # Verify observability manager was used to register provider
+    # Check that register_provider was called with a LangfuseProvider instance
+    assert mock_manager.register_provider.called, "register_provider should be called"
+    call_args = mock_manager.register_provider.call_args
+    assert call_args is not None
+    # Verify it was called with a LangfuseProvider (check by type/class name)
+    assert isinstance(call_args[0][0], LangfuseProvider), (
+        "register_provider should be called with LangfuseProvider instance"
+    )
 
-        # Verify cleanup
-        mock_event_store.stop_cleanup_task.assert_called_once()
-        mock_db_manager.close.assert_called_once()
+    # Verify cleanup
+    lifespan_mocks.event_store.stop_cleanup_task.assert_called_once()
+    lifespan_mocks.db_manager.close.assert_called_once()
@@ -1,9 +1,12 @@
 """Unit tests for observability base system"""
 
-from unittest.mock import MagicMock
+import inspect
+import logging
+from dataclasses import dataclass, field
 
 import pytest
 
+import src.agent_server.observability.base as base_module
 from src.agent_server.observability.base import (
     ObservabilityManager,
     ObservabilityProvider,
@@ -11,17 +14,20 @@ from src.agent_server.observability.base import (
     get_tracing_callbacks,
     get_tracing_metadata,
 )
+from src.agent_server.observability.langfuse_integration import (
+    get_tracing_callbacks as langfuse_get_tracing_callbacks,
+)
 
 
+@dataclass(slots=True)
 class MockProvider(ObservabilityProvider):
     """Mock provider for testing"""
 
-    def __init__(self, enabled=True, callbacks=None, metadata=None):
-        self.enabled = enabled
-        self.callbacks = callbacks or []
-        self.metadata = metadata or {}
-        self.get_callbacks_called = False
-        self.get_metadata_called = False
+    enabled: bool = True
+    callbacks: list = field(default_factory=list)
+    metadata: dict = field(default_factory=dict)
+    get_callbacks_called: bool = False
+    get_metadata_called: bool = False
 
     def get_callbacks(self):
         self.get_callbacks_called = True
@@ -35,13 +41,47 @@ class MockProvider(ObservabilityProvider):
         return self.enabled
 
 
+class FailingCallbacksProvider(MockProvider):
+    """Provider whose get_callbacks always raises; built once at import
+    instead of a throwaway class per test invocation."""
+
+    def get_callbacks(self):
+        raise Exception("Callback error")
+
+
+class FailingMetadataProvider(MockProvider):
+    """Provider whose get_metadata always raises."""
+
+    def get_metadata(self, run_id, thread_id, user_identity=None):
+        raise Exception("Metadata error")
+
+
+@pytest.fixture
+def fresh_manager(monkeypatch):
+    """Install a fresh manager as the module singleton for one test.
+
+    Tests previously constructed local managers or cleared the global
+    singleton's provider list in place, which leaked state across tests;
+    monkeypatch restores the real singleton at teardown.
+    """
+    manager = ObservabilityManager()
+    monkeypatch.setattr(base_module, "_observability_manager", manager)
+    return manager
+
+
 class TestObservabilityProvider:
     """Test the ObservabilityProvider abstract base class"""
 
     def test_observability_provider_is_abstract(self):
         """Test that ObservabilityProvider cannot be instantiated directly"""
-        with pytest.raises(TypeError):
-            ObservabilityProvider()
+        # Introspection is a strictly stronger check than catching the
+        # TypeError from an attempted instantiation, without the exception
+        assert inspect.isabstract(ObservabilityProvider)
+        assert ObservabilityProvider.__abstractmethods__ >= {
+            "get_callbacks",
+            "get_metadata",
+            "is_enabled",
+        }
 
     def test_mock_provider_implements_interface(self):
         """Test that MockProvider implements the required interface"""
@@ -55,14 +95,14 @@ class TestObservabilityProvider:
 class TestObservabilityManager:
     """Test the ObservabilityManager class"""
 
-    def test_manager_initializes_empty(self):
+    def test_manager_initializes_empty(self, fresh_manager):
         """Test that manager starts with no providers"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         assert len(manager._providers) == 0
 
-    def test_register_enabled_provider(self):
+    def test_register_enabled_provider(self, fresh_manager):
         """Test registering an enabled provider"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         provider = MockProvider(enabled=True)
 
         manager.register_provider(provider)
@@ -70,27 +110,27 @@ class TestObservabilityManager:
         assert len(manager._providers) == 1
         assert provider in manager._providers
 
-    def test_register_disabled_provider_ignored(self):
+    def test_register_disabled_provider_ignored(self, fresh_manager):
         """Test that disabled providers are not registered"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         provider = MockProvider(enabled=False)
 
         manager.register_provider(provider)
 
         assert len(manager._providers) == 0
 
-    def test_get_all_callbacks_empty(self):
+    def test_get_all_callbacks_empty(self, fresh_manager):
         """Test getting callbacks when no providers are registered"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         callbacks = manager.get_all_callbacks()
 
         assert callbacks == []
         assert isinstance(callbacks, list)
 
-    def test_get_all_callbacks_single_provider(self):
+    def test_get_all_callbacks_single_provider(self, fresh_manager):
         """Test getting callbacks from a single provider"""
-        manager = ObservabilityManager()
-        mock_callback = MagicMock()
+        manager = fresh_manager
+        mock_callback = object()
         provider = MockProvider(callbacks=[mock_callback])
 
         manager.register_provider(provider)
@@ -100,11 +140,11 @@ class TestObservabilityManager:
         assert callbacks[0] == mock_callback
         assert provider.get_callbacks_called is True
 
-    def test_get_all_callbacks_multiple_providers(self):
+    def test_get_all_callbacks_multiple_providers(self, fresh_manager):
         """Test getting callbacks from multiple providers"""
-        manager = ObservabilityManager()
-        callback1 = MagicMock()
-        callback2 = MagicMock()
+        manager = fresh_manager
+        callback1 = object()
+        callback2 = object()
         provider1 = MockProvider(callbacks=[callback1])
         provider2 = MockProvider(callbacks=[callback2])
 
@@ -116,33 +156,35 @@ class TestObservabilityManager:
         assert callback1 in callbacks
         assert callback2 in callbacks
 
-    def test_get_all_callbacks_handles_exceptions(self, caplog):
+    def test_get_all_callbacks_handles_exceptions(self, fresh_manager, caplog):
         """Test that exceptions in provider callbacks are handled gracefully"""
-        manager = ObservabilityManager()
-
-        class FailingProvider(MockProvider):
-            def get_callbacks(self):
-                raise Exception("Callback error")
+        # Capture only this module's error records; caplog.text would
+        # re-concatenate every captured record on each access
+        caplog.set_level(logging.ERROR, logger=base_module.logger.name)
+        manager = fresh_manager
 
-        provider = FailingProvider()
+        provider = FailingCallbacksProvider()
         manager.register_provider(provider)
 
         callbacks = manager.get_all_callbacks()
 
         assert callbacks == []
-        assert "Failed to get callbacks from FailingProvider" in caplog.text
+        assert any(
+            "Failed to get callbacks from FailingCallbacksProvider" in msg
+            for _, _, msg in caplog.record_tuples
+        )
 
-    def test_get_all_metadata_empty(self):
+    def test_get_all_metadata_empty(self, fresh_manager):
         """Test getting metadata when no providers are registered"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         metadata = manager.get_all_metadata("run1", "thread1")
 
         assert metadata == {}
         assert isinstance(metadata, dict)
 
-    def test_get_all_metadata_single_provider(self):
+    def test_get_all_metadata_single_provider(self, fresh_manager):
         """Test getting metadata from a single provider"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         provider_metadata = {"key1": "value1", "key2": "value2"}
         provider = MockProvider(metadata=provider_metadata)
 
@@ -152,9 +194,9 @@ class TestObservabilityManager:
         assert metadata == provider_metadata
         assert provider.get_metadata_called is True
 
-    def test_get_all_metadata_multiple_providers(self):
+    def test_get_all_metadata_multiple_providers(self, fresh_manager):
         """Test getting metadata from multiple providers"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         provider1 = MockProvider(metadata={"key1": "value1"})
         provider2 = MockProvider(metadata={"key2": "value2"})
 
@@ -164,9 +206,9 @@ class TestObservabilityManager:
 
         assert metadata == {"key1": "value1", "key2": "value2"}
 
-    def test_get_all_metadata_merges_correctly(self):
+    def test_get_all_metadata_merges_correctly(self, fresh_manager):
         """Test that metadata from multiple providers merges correctly"""
-        manager = ObservabilityManager()
+        manager = fresh_manager
         provider1 = MockProvider(metadata={"common": "value1", "unique1": "data1"})
         provider2 = MockProvider(metadata={"common": "value2", "unique2": "data2"})
 
@@ -177,21 +219,21 @@ class TestObservabilityManager:
         # Later provider should override common keys
         assert metadata == {"common": "value2", "unique1": "data1", "unique2": "data2"}
 
-    def test_get_all_metadata_handles_exceptions(self, caplog):
+    def test_get_all_metadata_handles_exceptions(self, fresh_manager, caplog):
         """Test that exceptions in provider metadata are handled gracefully"""
-        manager = ObservabilityManager()
+        caplog.set_level(logging.ERROR, logger=base_module.logger.name)
+        manager = fresh_manager
 
-        class FailingProvider(MockProvider):
-            def get_metadata(self, run_id, thread_id, user_identity=None):
-                raise Exception("Metadata error")
-
-        provider = FailingProvider()
+        provider = FailingMetadataProvider()
         manager.register_provider(provider)
 
         metadata = manager.get_all_metadata("run1", "thread1")
 
         assert metadata == {}
-        assert "Failed to get metadata from FailingProvider" in caplog.text
+        assert any(
+            "Failed to get metadata from FailingMetadataProvider" in msg
+            for _, _, msg in caplog.record_tuples
+        )
 
 
 class TestGlobalFunctions:
@@ -205,10 +247,10 @@ class TestGlobalFunctions:
         assert manager1 is manager2
         assert isinstance(manager1, ObservabilityManager)
 
-    def test_get_tracing_callbacks_delegates_to_manager(self):
+    def test_get_tracing_callbacks_delegates_to_manager(self, fresh_manager):
         """Test that get_tracing_callbacks delegates to the manager"""
-        manager = get_observability_manager()
-        mock_callback = MagicMock()
+        manager = fresh_manager
+        mock_callback = object()
         provider = MockProvider(callbacks=[mock_callback])
 
         manager.register_provider(provider)
@@ -217,9 +259,9 @@ class TestGlobalFunctions:
         assert len(callbacks) == 1
         assert callbacks[0] == mock_callback
 
-    def test_get_tracing_metadata_delegates_to_manager(self):
+    def test_get_tracing_metadata_delegates_to_manager(self, fresh_manager):
         """Test that get_tracing_metadata delegates to the manager"""
-        manager = get_observability_manager()
+        manager = fresh_manager
         provider_metadata = {"test_key": "test_value"}
         provider = MockProvider(metadata=provider_metadata)
 
@@ -228,9 +270,9 @@ class TestGlobalFunctions:
 
         assert metadata == provider_metadata
 
-    def test_get_tracing_metadata_with_none_user(self):
+    def test_get_tracing_metadata_with_none_user(self, fresh_manager):
         """Test get_tracing_metadata with None user_identity"""
-        manager = get_observability_manager()
+        manager = fresh_manager
         provider_metadata = {"test_key": "test_value"}
         provider = MockProvider(metadata=provider_metadata)
 
@@ -244,18 +286,13 @@ class TestGlobalFunctions:
 class TestIntegrationWithLangfuse:
     """Test integration with the existing Langfuse provider"""
 
-    def test_langfuse_provider_registers_automatically(self):
+    def test_langfuse_provider_registers_automatically(self, fresh_manager):
         """Test that Langfuse provider registers automatically when called"""
         # Get initial count
-        manager = get_observability_manager()
+        manager = fresh_manager
         initial_count = len(manager._providers)
 
-        # Import and call the function
-        from src.agent_server.observability.langfuse_integration import (
-            get_tracing_callbacks,
-        )
-
-        callbacks = get_tracing_callbacks()
+        callbacks = langfuse_get_tracing_callbacks()
 
         # Should have registered the Langfuse provider (or it was already registered)
         assert len(manager._providers) >= initial_count
@@ -263,20 +300,14 @@ class TestIntegrationWithLangfuse:
         # The important thing is that the provider was registered
         assert isinstance(callbacks, list)
 
-    def test_multiple_calls_dont_duplicate_providers(self):
+    def test_multiple_calls_dont_duplicate_providers(self, fresh_manager):
         """Test that multiple calls don't register the same provider multiple times"""
-        manager = get_observability_manager()
-        # Clear any existing providers first
-        manager._providers.clear()
-
-        from src.agent_server.observability.langfuse_integration import (
-            get_tracing_callbacks,
-        )
+        manager = fresh_manager
 
         # Call multiple times
-        get_tracing_callbacks()
-        get_tracing_callbacks()
-        get_tracing_callbacks()
+        langfuse_get_tracing_callbacks()
+        langfuse_get_tracing_callbacks()
+        langfuse_get_tracing_callbacks()
 
         # Should have at most one provider registered (not duplicated)
         # If LANGFUSE_LOGGING is disabled, provider count may be 0
@@ -4,6 +4,11 @@ import importlib
 import logging
 from unittest.mock import MagicMock, patch
 
+from src.agent_server.observability.base import (
+    ObservabilityProvider,
+    get_observability_manager,
+)
+
 
 def reload_langfuse_module():
     """Helper to reload the langfuse_integration module"""
@@ -312,8 +317,6 @@ class TestGetTracingCallbacks:
 
     def test_env_var_case_insensitive(self, monkeypatch):
         """Test that environment variable value is case-insensitive"""
-        from src.agent_server.observability.base import get_observability_manager
-
         test_cases = ["true", "True", "TRUE", "TrUe"]
 
         for value in test_cases:
@@ -350,8 +353,6 @@ class TestLangfuseProvider:
         langfuse_module = reload_langfuse_module()
         provider = langfuse_module.LangfuseProvider()
 
-        from src.agent_server.observability.base import ObservabilityProvider
-
         assert isinstance(provider, ObservabilityProvider)
 
     def test_langfuse_provider_enabled_when_env_true(self, monkeypatch):
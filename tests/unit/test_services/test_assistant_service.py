@@ -12,7 +12,12 @@ import pytest
 from fastapi import HTTPException
 
 from agent_server.models import Assistant, AssistantCreate, AssistantUpdate
-from agent_server.services.assistant_service import AssistantService, to_pydantic
+from agent_server.services.assistant_service import (
+    AssistantService,
+    _decode_cursor,
+    _encode_cursor,
+    to_pydantic,
+)
 
 
 @pytest.fixture
@@ -26,6 +31,7 @@ def mock_langgraph_service():
     """Mock LangGraphService for testing"""
     mock_service = Mock()
     mock_service.list_graphs.return_value = {"test-graph": {}}
+    mock_service.available_graph_ids = frozenset({"test-graph"})
     mock_service.get_graph = AsyncMock(return_value=Mock())
     return mock_service
 
@@ -104,10 +110,10 @@ class TestToPydantic:
             mock_column11,
         ]
         mock_orm.__table__ = mock_table
-        mock_orm.assistant_id = uuid.uuid4()
+        mock_orm.assistant_id = str(uuid.uuid4())
         mock_orm.name = "Test Assistant"
         mock_orm.description = "Test Description"
-        mock_orm.user_id = uuid.uuid4()
+        mock_orm.user_id = str(uuid.uuid4())
         mock_orm.graph_id = "test-graph"
         mock_orm.version = 1
         mock_orm.created_at = datetime.now(UTC)
@@ -124,8 +130,8 @@ class TestToPydantic:
         assert isinstance(result.assistant_id, str)
         assert isinstance(result.user_id, str)
 
-    def test_to_pydantic_uuid_conversion(self):
-        """Test UUID to string conversion"""
+    def test_to_pydantic_str_ids_pass_through(self):
+        """Test that TEXT-column string ids pass through unchanged"""
         mock_orm = Mock()
         mock_table = Mock()
         mock_column1 = Mock()
@@ -161,11 +167,11 @@ class TestToPydantic:
             mock_column10,
         ]
         mock_orm.__table__ = mock_table
-        test_uuid = uuid.uuid4()
-        mock_orm.assistant_id = test_uuid
+        test_id = str(uuid.uuid4())
+        mock_orm.assistant_id = test_id
         mock_orm.name = "Test Assistant"
         mock_orm.description = "Test description"
-        mock_orm.user_id = test_uuid
+        mock_orm.user_id = test_id
         mock_orm.graph_id = "test-graph"
         mock_orm.version = 1
         mock_orm.created_at = datetime.now(UTC)
@@ -176,8 +182,8 @@ class TestToPydantic:
 
         result = to_pydantic(mock_orm)
 
-        assert result.assistant_id == str(test_uuid)
-        assert result.user_id == str(test_uuid)
+        assert result.assistant_id == test_id
+        assert result.user_id == test_id
 
     def test_to_pydantic_none_values(self):
         """Test handling of None values"""
@@ -243,9 +249,9 @@ class TestAssistantServiceCreate:
     ):
         """Test successful graph validation"""
         # Setup mocks
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.return_value = Mock()
 
         # Mock database operations
@@ -266,28 +272,16 @@ class TestAssistantServiceCreate:
         assistant_service.session.add = Mock()
         assistant_service.session.commit = AsyncMock()
 
-        # Mock refresh to populate the mock object with attributes
-        def mock_refresh(obj):
-            obj.assistant_id = "test-id"
-            obj.name = "Test Assistant"
-            obj.description = "Test description"
-            obj.user_id = "user-123"
-            obj.graph_id = "test-graph"
-            obj.version = 1
-            obj.created_at = datetime.now(UTC)
-            obj.updated_at = datetime.now(UTC)
-            obj.config = {}
-            obj.context = {}
-            obj.metadata_dict = {}
-
-        assistant_service.session.refresh = AsyncMock(side_effect=mock_refresh)
+        # Mock the INSERT ... ON CONFLICT DO NOTHING RETURNING result
+        insert_result = Mock()
+        insert_result.scalar_one_or_none.return_value = "test-id"
+        assistant_service.session.execute = AsyncMock(return_value=insert_result)
 
         result = await assistant_service.create_assistant(
             sample_assistant_create, "user-123"
         )
 
         assert isinstance(result, Assistant)
-        assistant_service.langgraph_service.list_graphs.assert_called_once()
         assistant_service.langgraph_service.get_graph.assert_called_once_with(
             "test-graph"
         )
@@ -297,9 +291,9 @@ class TestAssistantServiceCreate:
         self, assistant_service, sample_assistant_create
     ):
         """Test graph not found error"""
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "other-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"other-graph"}
+        )
 
         with pytest.raises(HTTPException) as exc_info:
             await assistant_service.create_assistant(
@@ -314,9 +308,9 @@ class TestAssistantServiceCreate:
         self, assistant_service, sample_assistant_create
     ):
         """Test graph loading failure"""
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.side_effect = Exception(
             "Graph load failed"
         )
@@ -338,9 +332,9 @@ class TestAssistantServiceCreate:
             context={"other_key": "other_value"},
         )
 
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.return_value = Mock()
 
         with pytest.raises(HTTPException) as exc_info:
@@ -362,29 +356,18 @@ class TestAssistantServiceCreate:
             context=None,
         )
 
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.return_value = Mock()
         assistant_service.session.scalar.return_value = None
         assistant_service.session.add = Mock()
         assistant_service.session.commit = AsyncMock()
 
-        # Mock refresh to populate the mock object with attributes
-        def mock_refresh(obj):
-            obj.assistant_id = "test-id"
-            obj.name = "Test Assistant"
-            obj.description = "Test description"
-            obj.user_id = "user-123"
-            obj.graph_id = "test-graph"
-            obj.version = 1
-            obj.created_at = datetime.now(UTC)
-            obj.updated_at = datetime.now(UTC)
-            obj.config = {"configurable": {"key": "value"}}
-            obj.context = {"key": "value"}
-            obj.metadata_dict = {}
-
-        assistant_service.session.refresh = AsyncMock(side_effect=mock_refresh)
+        # Mock the INSERT ... ON CONFLICT DO NOTHING RETURNING result
+        insert_result = Mock()
+        insert_result.scalar_one_or_none.return_value = "test-id"
+        assistant_service.session.execute = AsyncMock(return_value=insert_result)
 
         result = await assistant_service.create_assistant(request, "user-123")
 
@@ -402,29 +385,18 @@ class TestAssistantServiceCreate:
             context={"key": "value"},
         )
 
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.return_value = Mock()
         assistant_service.session.scalar.return_value = None
         assistant_service.session.add = Mock()
         assistant_service.session.commit = AsyncMock()
 
-        # Mock refresh to populate the mock object with attributes
-        def mock_refresh(obj):
-            obj.assistant_id = "test-id"
-            obj.name = "Test Assistant"
-            obj.description = "Test description"
-            obj.user_id = "user-123"
-            obj.graph_id = "test-graph"
-            obj.version = 1
-            obj.created_at = datetime.now(UTC)
-            obj.updated_at = datetime.now(UTC)
-            obj.config = {"configurable": {"key": "value"}}
-            obj.context = {"key": "value"}
-            obj.metadata_dict = {}
-
-        assistant_service.session.refresh = AsyncMock(side_effect=mock_refresh)
+        # Mock the INSERT ... ON CONFLICT DO NOTHING RETURNING result
+        insert_result = Mock()
+        insert_result.scalar_one_or_none.return_value = "test-id"
+        assistant_service.session.execute = AsyncMock(return_value=insert_result)
 
         result = await assistant_service.create_assistant(request, "user-123")
 
@@ -461,10 +433,15 @@ class TestAssistantServiceCreate:
         mock_table.columns = [mock_column]
         existing_assistant.__table__ = mock_table
 
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.return_value = Mock()
+
+        # Insert conflicts (no row returned), then the existing row is fetched
+        insert_result = Mock()
+        insert_result.scalar_one_or_none.return_value = None
+        assistant_service.session.execute = AsyncMock(return_value=insert_result)
         assistant_service.session.scalar.return_value = existing_assistant
 
         result = await assistant_service.create_assistant(request, "user-123")
@@ -486,10 +463,15 @@ class TestAssistantServiceCreate:
         existing_assistant = Mock()
         existing_assistant.assistant_id = "existing-id"
 
-        assistant_service.langgraph_service.list_graphs.return_value = {
-            "test-graph": {}
-        }
+        assistant_service.langgraph_service.available_graph_ids = frozenset(
+            {"test-graph"}
+        )
         assistant_service.langgraph_service.get_graph.return_value = Mock()
+
+        # Insert conflicts (no row returned), then the existing row is fetched
+        insert_result = Mock()
+        insert_result.scalar_one_or_none.return_value = None
+        assistant_service.session.execute = AsyncMock(return_value=insert_result)
         assistant_service.session.scalar.return_value = existing_assistant
 
         with pytest.raises(HTTPException) as exc_info:
@@ -617,13 +599,11 @@ class TestAssistantServiceUpdate:
         mock_table.columns = [mock_column1, mock_column2, mock_column3, mock_column4]
         mock_assistant.__table__ = mock_table
 
-        # Mock scalar calls: first returns assistant, second returns max version, third returns updated assistant
-        assistant_service.session.scalar.side_effect = [
-            mock_assistant,
-            1,
-            mock_assistant,
-        ]
-        assistant_service.session.execute = AsyncMock()
+        # The atomic UPDATE ... RETURNING hands back the updated row
+        mock_assistant.version = 2
+        update_result = Mock()
+        update_result.scalar_one_or_none.return_value = mock_assistant
+        assistant_service.session.execute = AsyncMock(return_value=update_result)
         assistant_service.session.commit = AsyncMock()
 
         result = await assistant_service.update_assistant(
@@ -631,6 +611,7 @@ class TestAssistantServiceUpdate:
         )
 
         assert isinstance(result, Assistant)
+        assert result.version == 2
         assistant_service.session.execute.assert_called_once()
         assistant_service.session.commit.assert_called()
 
@@ -639,7 +620,9 @@ class TestAssistantServiceUpdate:
         self, assistant_service, sample_assistant_update
     ):
         """Test update of non-existent assistant"""
-        assistant_service.session.scalar.return_value = None
+        update_result = Mock()
+        update_result.scalar_one_or_none.return_value = None
+        assistant_service.session.execute = AsyncMock(return_value=update_result)
 
         with pytest.raises(HTTPException) as exc_info:
             await assistant_service.update_assistant(
@@ -672,24 +655,23 @@ class TestAssistantServiceDelete:
     @pytest.mark.asyncio
     async def test_delete_assistant_success(self, assistant_service):
         """Test successful assistant deletion"""
-        # Mock existing assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-
-        assistant_service.session.scalar.return_value = mock_assistant
-        assistant_service.session.delete = AsyncMock()
+        delete_result = Mock()
+        delete_result.rowcount = 1
+        assistant_service.session.execute = AsyncMock(return_value=delete_result)
         assistant_service.session.commit = AsyncMock()
 
         result = await assistant_service.delete_assistant("test-id", "user-123")
 
         assert result == {"status": "deleted"}
-        assistant_service.session.delete.assert_called_once_with(mock_assistant)
+        assistant_service.session.execute.assert_called_once()
         assistant_service.session.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_delete_assistant_not_found(self, assistant_service):
         """Test deletion of non-existent assistant"""
-        assistant_service.session.scalar.return_value = None
+        delete_result = Mock()
+        delete_result.rowcount = 0
+        assistant_service.session.execute = AsyncMock(return_value=delete_result)
 
         with pytest.raises(HTTPException) as exc_info:
             await assistant_service.delete_assistant("nonexistent", "user-123")
@@ -726,12 +708,10 @@ class TestAssistantServiceVersionManagement:
         mock_version.context = {"ctx": "val"}
         mock_version.graph_id = "test-graph"
 
-        assistant_service.session.scalar.side_effect = [
-            mock_assistant,
-            mock_version,
-            mock_assistant,
-        ]
-        assistant_service.session.execute = AsyncMock()
+        assistant_service.session.scalar.return_value = mock_version
+        update_result = Mock()
+        update_result.scalar_one_or_none.return_value = mock_assistant
+        assistant_service.session.execute = AsyncMock(return_value=update_result)
         assistant_service.session.commit = AsyncMock()
 
         result = await assistant_service.set_assistant_latest("test-id", 2, "user-123")
@@ -743,7 +723,11 @@ class TestAssistantServiceVersionManagement:
     @pytest.mark.asyncio
     async def test_set_assistant_latest_assistant_not_found(self, assistant_service):
         """Test setting latest version for non-existent assistant"""
-        assistant_service.session.scalar.return_value = None
+        # The version row exists but the UPDATE matches no assistant row
+        assistant_service.session.scalar.return_value = Mock()
+        update_result = Mock()
+        update_result.scalar_one_or_none.return_value = None
+        assistant_service.session.execute = AsyncMock(return_value=update_result)
 
         with pytest.raises(HTTPException) as exc_info:
             await assistant_service.set_assistant_latest("nonexistent", 2, "user-123")
@@ -754,11 +738,7 @@ class TestAssistantServiceVersionManagement:
     @pytest.mark.asyncio
     async def test_set_assistant_latest_version_not_found(self, assistant_service):
         """Test setting non-existent version as latest"""
-        # Mock existing assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-
-        assistant_service.session.scalar.side_effect = [mock_assistant, None]
+        assistant_service.session.scalar.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
             await assistant_service.set_assistant_latest("test-id", 999, "user-123")
@@ -821,22 +801,94 @@ class TestAssistantServiceSearch:
         assert result == 0
 
 
+class TestAssistantServiceCursorSearch:
+    """Test keyset-paginated assistant search"""
+
+    @staticmethod
+    def _make_row(index: int):
+        row = Mock()
+        row.assistant_id = f"asst-{index}"
+        row.name = f"Assistant {index}"
+        row.description = None
+        row.config = {}
+        row.context = {}
+        row.graph_id = "test-graph"
+        row.user_id = "user-123"
+        row.version = 1
+        row.metadata_dict = {}
+        row.created_at = datetime(2026, 8, 28, 0, 0, index, tzinfo=UTC)
+        row.updated_at = row.created_at
+        return row
+
+    @staticmethod
+    def _make_request(limit: int, cursor_after: str | None = None):
+        request = Mock()
+        request.name = None
+        request.description = None
+        request.graph_id = None
+        request.metadata = None
+        request.limit = limit
+        request.offset = 0
+        request.cursor_after = cursor_after
+        return request
+
+    def test_cursor_roundtrip(self):
+        """Test cursor encode/decode symmetry"""
+        now = datetime.now(UTC)
+        cursor = _encode_cursor(now, "asst-1")
+
+        timestamp, assistant_id = _decode_cursor(cursor)
+
+        assert timestamp == now
+        assert assistant_id == "asst-1"
+
+    def test_decode_cursor_invalid(self):
+        """Test malformed cursor raises 400"""
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor("not a cursor")
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_cursor_search_emits_next_cursor(self, assistant_service):
+        """Test that a full page plus one row yields a next_cursor"""
+        rows = [self._make_row(i) for i in range(3, 0, -1)]
+        mock_result = Mock()
+        mock_result.all.return_value = rows
+        assistant_service.session.scalars.return_value = mock_result
+
+        assistants, next_cursor = await assistant_service.search_assistants_cursor(
+            self._make_request(limit=2), "user-123"
+        )
+
+        assert len(assistants) == 2
+        assert next_cursor == _encode_cursor(rows[1].created_at, rows[1].assistant_id)
+
+    @pytest.mark.asyncio
+    async def test_cursor_search_last_page(self, assistant_service):
+        """Test that a short page yields no next_cursor"""
+        rows = [self._make_row(1)]
+        mock_result = Mock()
+        mock_result.all.return_value = rows
+        assistant_service.session.scalars.return_value = mock_result
+
+        assistants, next_cursor = await assistant_service.search_assistants_cursor(
+            self._make_request(limit=2, cursor_after=_encode_cursor(
+                datetime.now(UTC), "asst-5"
+            )),
+            "user-123",
+        )
+
+        assert len(assistants) == 1
+        assert next_cursor is None
+
+
 class TestAssistantServiceSchemas:
     """Test assistant schema extraction logic"""
 
     @pytest.mark.asyncio
     async def test_get_assistant_schemas_success(self, assistant_service):
         """Test successful schema extraction"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
         # Mock graph with schemas
         mock_graph = Mock()
         mock_graph.get_input_jsonschema.return_value = {"type": "object"}
@@ -847,7 +899,8 @@ class TestAssistantServiceSchemas:
         mock_graph.config_schema.return_value = Mock()
         mock_graph.get_context_jsonschema.return_value = {"type": "object"}
 
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        assistant_service.session.scalar.return_value = "test-graph"
         assistant_service.langgraph_service.get_graph.return_value = mock_graph
 
         result = await assistant_service.get_assistant_schemas("test-id", "user-123")
@@ -857,6 +910,12 @@ class TestAssistantServiceSchemas:
         assert "output_schema" in result
         assert result["graph_id"] == "test-graph"
 
+        # A second call serves the schemas from the per-graph cache
+        assistant_service.langgraph_service.get_graph.reset_mock()
+        cached = await assistant_service.get_assistant_schemas("test-id", "user-123")
+        assert cached == result
+        assistant_service.langgraph_service.get_graph.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_assistant_schemas_assistant_not_found(self, assistant_service):
         """Test schema extraction for non-existent assistant"""
@@ -871,17 +930,9 @@ class TestAssistantServiceSchemas:
     @pytest.mark.asyncio
     async def test_get_assistant_schemas_graph_failure(self, assistant_service):
         """Test schema extraction with graph loading failure"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        # (distinct graph_id so the schema cache stays cold)
+        assistant_service.session.scalar.return_value = "failing-graph"
         assistant_service.langgraph_service.get_graph.side_effect = Exception(
             "Graph load failed"
         )
@@ -899,16 +950,6 @@ class TestAssistantServiceGraph:
     @pytest.mark.asyncio
     async def test_get_assistant_graph_success(self, assistant_service):
         """Test successful graph retrieval"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
         # Mock graph
         mock_graph = Mock()
         mock_drawable_graph = Mock()
@@ -918,7 +959,8 @@ class TestAssistantServiceGraph:
 
         mock_graph.aget_graph = AsyncMock(return_value=mock_drawable_graph)
 
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        assistant_service.session.scalar.return_value = "test-graph"
         assistant_service.langgraph_service.get_graph.return_value = mock_graph
 
         result = await assistant_service.get_assistant_graph(
@@ -932,21 +974,12 @@ class TestAssistantServiceGraph:
     @pytest.mark.asyncio
     async def test_get_assistant_graph_invalid_xray(self, assistant_service):
         """Test graph retrieval with invalid xray parameter"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
         # Mock graph
         mock_graph = Mock()
         mock_graph.aget_graph.return_value = Mock()
 
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        assistant_service.session.scalar.return_value = "test-graph"
         assistant_service.langgraph_service.get_graph.return_value = mock_graph
 
         with pytest.raises(HTTPException) as exc_info:
@@ -958,21 +991,12 @@ class TestAssistantServiceGraph:
     @pytest.mark.asyncio
     async def test_get_assistant_graph_not_implemented(self, assistant_service):
         """Test graph retrieval with unsupported visualization"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
         # Mock graph
         mock_graph = Mock()
         mock_graph.aget_graph.side_effect = NotImplementedError("Not supported")
 
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        assistant_service.session.scalar.return_value = "test-graph"
         assistant_service.langgraph_service.get_graph.return_value = mock_graph
 
         with pytest.raises(HTTPException) as exc_info:
@@ -988,16 +1012,6 @@ class TestAssistantServiceSubgraphs:
     @pytest.mark.asyncio
     async def test_get_assistant_subgraphs_success(self, assistant_service):
         """Test successful subgraph retrieval"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
         # Mock graph
         mock_graph = Mock()
         mock_subgraph = Mock()
@@ -1014,7 +1028,8 @@ class TestAssistantServiceSubgraphs:
 
         mock_graph.aget_subgraphs = mock_aget_subgraphs
 
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        assistant_service.session.scalar.return_value = "test-graph"
         assistant_service.langgraph_service.get_graph.return_value = mock_graph
 
         result = await assistant_service.get_assistant_subgraphs(
@@ -1027,21 +1042,12 @@ class TestAssistantServiceSubgraphs:
     @pytest.mark.asyncio
     async def test_get_assistant_subgraphs_not_implemented(self, assistant_service):
         """Test subgraph retrieval with unsupported feature"""
-        # Mock assistant
-        mock_assistant = Mock()
-        mock_assistant.assistant_id = "test-id"
-        mock_assistant.graph_id = "test-graph"
-        mock_table = Mock()
-        mock_column = Mock()
-        mock_column.name = "assistant_id"
-        mock_table.columns = [mock_column]
-        mock_assistant.__table__ = mock_table
-
         # Mock graph
         mock_graph = Mock()
         mock_graph.aget_subgraphs.side_effect = NotImplementedError("Not supported")
 
-        assistant_service.session.scalar.return_value = mock_assistant
+        # The ownership lookup now resolves just the graph_id
+        assistant_service.session.scalar.return_value = "test-graph"
         assistant_service.langgraph_service.get_graph.return_value = mock_graph
 
         with pytest.raises(HTTPException) as exc_info:
@@ -163,7 +163,8 @@ class TestConfigurableJsonSchema:
 class TestExtractGraphSchemas:
     """Test graph schema extraction"""
 
-    def test_extract_graph_schemas_success(self):
+    @pytest.mark.asyncio
+    async def test_extract_graph_schemas_success(self):
         """Test successful graph schema extraction"""
         # Mock graph with all schema methods
         mock_graph = Mock()
@@ -190,7 +191,7 @@ class TestExtractGraphSchemas:
         mock_graph.config_type = Mock()
         mock_graph.config_type.__name__ = "TestConfig"
 
-        result = _extract_graph_schemas(mock_graph)
+        result = await _extract_graph_schemas(mock_graph)
 
         assert "input_schema" in result
         assert "output_schema" in result
@@ -202,7 +203,8 @@ class TestExtractGraphSchemas:
         assert result["output_schema"]["output"] is True
         assert result["context_schema"]["context"] is True
 
-    def test_extract_graph_schemas_partial_failure(self):
+    @pytest.mark.asyncio
+    async def test_extract_graph_schemas_partial_failure(self):
         """Test graph schema extraction with partial failures"""
         # Mock graph with some failing methods
         mock_graph = Mock()
@@ -218,7 +220,7 @@ class TestExtractGraphSchemas:
         # Mock config schema failure
         mock_graph.config_schema.side_effect = Exception("Config error")
 
-        result = _extract_graph_schemas(mock_graph)
+        result = await _extract_graph_schemas(mock_graph)
 
         assert "input_schema" in result
         assert result["input_schema"] is not None
@@ -227,7 +229,8 @@ class TestExtractGraphSchemas:
         assert result["config_schema"] is None
         assert result["context_schema"] is None
 
-    def test_extract_graph_schemas_all_failures(self):
+    @pytest.mark.asyncio
+    async def test_extract_graph_schemas_all_failures(self):
         """Test graph schema extraction with all failures"""
         # Mock graph with all failing methods
         mock_graph = Mock()
@@ -243,7 +246,7 @@ class TestExtractGraphSchemas:
         # Mock config schema failure
         mock_graph.config_schema.side_effect = Exception("Config error")
 
-        result = _extract_graph_schemas(mock_graph)
+        result = await _extract_graph_schemas(mock_graph)
 
         assert "input_schema" in result
         assert "output_schema" in result
@@ -258,7 +261,8 @@ class TestExtractGraphSchemas:
         assert result["config_schema"] is None
         assert result["context_schema"] is None
 
-    def test_extract_graph_schemas_complex_state(self):
+    @pytest.mark.asyncio
+    async def test_extract_graph_schemas_complex_state(self):
         """Test graph schema extraction with complex state"""
         # Mock graph with complex state
         mock_graph = Mock()
@@ -288,13 +292,14 @@ class TestExtractGraphSchemas:
             }
             mp.setattr("pydantic.TypeAdapter", lambda x: mock_adapter)
 
-            result = _extract_graph_schemas(mock_graph)
+            result = await _extract_graph_schemas(mock_graph)
 
             assert "state_schema" in result
             assert result["state_schema"] is not None
             assert "properties" in result["state_schema"]
 
-    def test_extract_graph_schemas_empty_graph(self):
+    @pytest.mark.asyncio
+    async def test_extract_graph_schemas_empty_graph(self):
         """Test graph schema extraction with empty graph"""
         # Mock empty graph
         mock_graph = Mock()
@@ -312,7 +317,7 @@ class TestExtractGraphSchemas:
         mock_graph.config_schema.return_value.model_fields = {}
         mock_graph.config_type = None
 
-        result = _extract_graph_schemas(mock_graph)
+        result = await _extract_graph_schemas(mock_graph)
 
         assert "input_schema" in result
         assert "output_schema" in result
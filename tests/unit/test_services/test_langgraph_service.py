@@ -386,6 +386,20 @@ class TestLangGraphServiceGraphs:
 
         assert result == {}
 
+    def test_load_graph_registry_caches_graph_ids(self):
+        """Test that loading the registry freezes the set of valid graph ids"""
+        service = LangGraphService()
+        service.config = {
+            "graphs": {
+                "graph1": "./graphs/one.py:graph",
+                "graph2": "./graphs/two.py:graph",
+            }
+        }
+
+        service._load_graph_registry()
+
+        assert service.available_graph_ids == frozenset({"graph1", "graph2"})
+
 
 class TestLangGraphServiceCache:
     """Test cache management"""
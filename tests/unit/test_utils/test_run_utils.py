@@ -1,26 +1,39 @@
 import pytest
 
-
-def test_merge_jsonb_and_should_skip_event():
-    # Import inside test to ensure package import resolution in test env
-    from agent_server.utils.run_utils import _merge_jsonb, _should_skip_event
-
-    # _merge_jsonb should merge dicts and ignore None
-    a = {"x": 1, "y": {"a": 2}}
-    b = {"y": {"b": 3}, "z": 4}
-    merged = _merge_jsonb(a, None, b)
-    assert merged["x"] == 1
-    assert merged["z"] == 4
-    # b should override a for top-level keys
-    assert merged["y"] == {"b": 3}
-
-    # _should_skip_event: tuple with last element being (something, metadata_dict)
-    raw_event = ("values", {"foo": "bar"}, ("meta", {"tags": ["langsmith:nostream"]}))
-    assert _should_skip_event(raw_event) is True
-
-    # Other shapes should not be skipped
-    assert _should_skip_event(("values", {"foo": "bar"})) is False
-    assert _should_skip_event("just-a-string") is False
+from agent_server.utils import run_utils
+from agent_server.utils.run_utils import _merge_jsonb, _should_skip_event
+
+
+@pytest.mark.parametrize(
+    "parts, key, expected",
+    [
+        # None parts are ignored
+        (({"x": 1, "y": {"a": 2}}, None, {"y": {"b": 3}, "z": 4}), "x", 1),
+        (({"x": 1, "y": {"a": 2}}, None, {"y": {"b": 3}, "z": 4}), "z", 4),
+        # later parts override earlier ones for top-level keys
+        (({"x": 1, "y": {"a": 2}}, None, {"y": {"b": 3}, "z": 4}), "y", {"b": 3}),
+    ],
+)
+def test_merge_jsonb(parts, key, expected):
+    merged = _merge_jsonb(*parts)
+    assert merged[key] == expected
+
+
+@pytest.mark.parametrize(
+    "raw_event, expected",
+    [
+        # tuple with last element being (something, metadata_dict) tagged nostream
+        (
+            ("values", {"foo": "bar"}, ("meta", {"tags": ["langsmith:nostream"]})),
+            True,
+        ),
+        # other shapes should not be skipped
+        (("values", {"foo": "bar"}), False),
+        ("just-a-string", False),
+    ],
+)
+def test_should_skip_event(raw_event, expected):
+    assert _should_skip_event(raw_event) is expected
 
 
 class DummyLogger:
@@ -31,15 +44,17 @@ class DummyLogger:
         self.calls.append((args, kwargs))
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_filter_no_schema_returns_same():
-    from agent_server.utils import run_utils
-
+@pytest.fixture
+def dummy_logger(monkeypatch):
+    """Swap run_utils.logger for a capturing dummy, restored at teardown."""
     dummy = DummyLogger()
-    # inject dummy logger to capture adebug
-    run_utils.logger = dummy
+    monkeypatch.setattr(run_utils, "logger", dummy)
+    return dummy
+
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_filter_no_schema_returns_same(dummy_logger):
     context = {"a": 1}
     result = await run_utils._filter_context_by_schema(context, None)
     # should return the context unchanged when no schema provided
@@ -48,12 +63,7 @@ async def test_filter_no_schema_returns_same():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_filter_with_schema_filters_keys():
-    from agent_server.utils import run_utils
-
-    dummy = DummyLogger()
-    run_utils.logger = dummy
-
+async def test_filter_with_schema_filters_keys(dummy_logger):
     context = {"a": 1, "b": 2}
     schema = {"properties": {"a": {}}}
 
@@ -61,20 +71,15 @@ async def test_filter_with_schema_filters_keys():
     assert filtered == {"a": 1}
 
     # ensure adebug was called for the filtered-out key
-    assert len(dummy.calls) == 1
-    _, kw = dummy.calls[0]
+    assert len(dummy_logger.calls) == 1
+    _, kw = dummy_logger.calls[0]
     assert kw.get("context_key") == "b"
     assert "available_keys" in kw
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_filter_with_empty_properties_returns_context():
-    from agent_server.utils import run_utils
-
-    dummy = DummyLogger()
-    run_utils.logger = dummy
-
+async def test_filter_with_empty_properties_returns_context(dummy_logger):
     context = {"a": 1}
     schema = {"properties": {}}
 